@@ -1,7 +1,7 @@
 # database.py
 import aiosqlite
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 import pytz
 
 ADELAIDE_TZ = pytz.timezone('Australia/Adelaide')
@@ -201,6 +201,16 @@ async def initialize_research_db():
                 ollama_model TEXT
             )
         ''')
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS research_sources (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                research_id INTEGER NOT NULL,
+                url TEXT,
+                title TEXT,
+                created_at TIMESTAMP NOT NULL
+            )
+        ''')
+        await db.execute('CREATE INDEX IF NOT EXISTS idx_research_sources_research ON research_sources(research_id)')
         await db.commit()
 
 async def initialize_research_jobs_db():
@@ -415,6 +425,90 @@ async def delete_cache_all():
         await db.execute('DELETE FROM fetch_cache')
         await db.commit()
 
+async def initialize_extraction_cache_db():
+    """Initializes the LLM extraction cache used by research.format_raw_results and research_pipeline."""
+    async with aiosqlite.connect(DATABASE_FILE) as db:
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS extraction_cache (
+                content_hash TEXT PRIMARY KEY,
+                model_name TEXT,
+                extracted TEXT NOT NULL,
+                created_at TIMESTAMP NOT NULL
+            )
+        ''')
+        await db.commit()
+
+async def get_cached_extraction(content_hash: str):
+    async with aiosqlite.connect(DATABASE_FILE) as db:
+        async with db.execute('SELECT extracted FROM extraction_cache WHERE content_hash = ?', (content_hash,)) as cursor:
+            row = await cursor.fetchone()
+            return row[0] if row else None
+
+async def upsert_cached_extraction(content_hash: str, model_name: str, extracted: str):
+    async with aiosqlite.connect(DATABASE_FILE) as db:
+        await db.execute(
+            'INSERT OR REPLACE INTO extraction_cache (content_hash, model_name, extracted, created_at) VALUES (?, ?, ?, ?)',
+            (content_hash, model_name, extracted, datetime.utcnow())
+        )
+        await db.commit()
+
+async def initialize_page_cache_db(max_age_hours: float | None = None, revalidate_hours: float | None = None):
+    """Initializes the article page cache used by research.format_raw_results, dropping expired rows.
+
+    Rows are keyed (canonical_url column) on the fetched URL as normalised by research._page_cache_key.
+    """
+    async with aiosqlite.connect(DATABASE_FILE) as db:
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS page_cache (
+                canonical_url TEXT PRIMARY KEY,
+                url TEXT,
+                text TEXT NOT NULL,
+                html TEXT,
+                fetched_at TIMESTAMP NOT NULL,
+                etag TEXT,
+                last_modified TEXT
+            )
+        ''')
+        async with db.execute("PRAGMA table_info(page_cache)") as cursor:
+            cols = {row[1] for row in await cursor.fetchall()}
+        if 'etag' not in cols:
+            await db.execute("ALTER TABLE page_cache ADD COLUMN etag TEXT")
+        if 'last_modified' not in cols:
+            await db.execute("ALTER TABLE page_cache ADD COLUMN last_modified TEXT")
+        if max_age_hours is not None:
+            # Expired pages carrying an ETag/Last-Modified are kept for conditional refetches
+            now = datetime.utcnow()
+            await db.execute(
+                'DELETE FROM page_cache WHERE fetched_at < ? AND ((etag IS NULL AND last_modified IS NULL) OR fetched_at < ?)',
+                (now - timedelta(hours=max_age_hours), now - timedelta(hours=max(max_age_hours, revalidate_hours or 0)))
+            )
+        await db.commit()
+
+async def get_cached_article(page_key: str, max_age_hours: float):
+    """Returns (text, html, etag, last_modified, fresh) for a cached page, or None."""
+    async with aiosqlite.connect(DATABASE_FILE) as db:
+        async with db.execute(
+            'SELECT text, html, etag, last_modified, fetched_at >= ? FROM page_cache WHERE canonical_url = ?',
+            (datetime.utcnow() - timedelta(hours=max_age_hours), page_key)
+        ) as cursor:
+            row = await cursor.fetchone()
+            return (row[0], row[1], row[2], row[3], bool(row[4])) if row else None
+
+async def upsert_cached_article(page_key: str, url: str, text: str, html: str | None,
+                                etag: str | None = None, last_modified: str | None = None):
+    async with aiosqlite.connect(DATABASE_FILE) as db:
+        await db.execute(
+            'INSERT OR REPLACE INTO page_cache (canonical_url, url, text, html, fetched_at, etag, last_modified) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (page_key, url, text, html, datetime.utcnow(), etag, last_modified)
+        )
+        await db.commit()
+
+async def touch_cached_article(page_key: str):
+    """Marks a cached page fresh again after the origin confirmed it unchanged (HTTP 304)."""
+    async with aiosqlite.connect(DATABASE_FILE) as db:
+        await db.execute('UPDATE page_cache SET fetched_at = ? WHERE canonical_url = ?', (datetime.utcnow(), page_key))
+        await db.commit()
+
 async def get_research_job(job_id: int):
     async with aiosqlite.connect(DATABASE_FILE) as db:
         db.row_factory = aiosqlite.Row
@@ -515,21 +609,34 @@ async def update_research_draft(draft_id: int, **fields):
         await db.execute(f'UPDATE research_drafts SET {cols} WHERE id = ?', vals)
         await db.commit()
 
-async def add_research(query: str, result: str, generation_time: float, ollama_server_name: str, ollama_model: str):
-    """Adds a new research entry to the database."""
+async def add_research(query: str, result: str, generation_time: float, ollama_server_name: str, ollama_model: str, sources: list[dict] | None = None):
+    """Adds a new research entry, and optionally its sources' URLs and titles, in a single transaction."""
     now = datetime.utcnow()
     async with aiosqlite.connect(DATABASE_FILE) as db:
-        await db.execute(
+        cursor = await db.execute(
             """
             INSERT INTO research (query, result, created_at, generation_time, ollama_server_name, ollama_model)
             VALUES (?, ?, ?, ?, ?, ?)
             """,
             (query, result, now, generation_time, ollama_server_name, ollama_model)
         )
+        research_id = cursor.lastrowid
+        if sources:
+            rows = [(research_id, s.get('url'), s.get('title'), now) for s in sources]
+            await db.executemany(
+                'INSERT INTO research_sources (research_id, url, title, created_at) VALUES (?, ?, ?, ?)',
+                rows
+            )
         await db.commit()
-        cursor = await db.execute('SELECT last_insert_rowid()')
-        row = await cursor.fetchone()
-        return int(row[0])
+        return int(research_id)
+
+async def get_research_sources(research_id: int):
+    """Retrieves the URLs and titles of the search results a research entry was generated from."""
+    async with aiosqlite.connect(DATABASE_FILE) as db:
+        db.row_factory = aiosqlite.Row
+        async with db.execute("SELECT url, title, created_at FROM research_sources WHERE research_id = ? ORDER BY id", (research_id,)) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(r) for r in rows]
 
 async def get_all_research():
     """Retrieve all research entries from the database."""
@@ -552,6 +659,7 @@ async def get_research_by_id(research_id: int):
 async def delete_research(research_id: int):
     """Deletes a research entry from the database."""
     async with aiosqlite.connect(DATABASE_FILE) as db:
+        await db.execute("DELETE FROM research_sources WHERE research_id = ?", (research_id,))
         await db.execute("DELETE FROM research WHERE id = ?", (research_id,))
         await db.commit()
 
@@ -6,7 +6,7 @@ from urllib.parse import urlparse
 
 import httpx
 
-from .utils import extract_links, canon_url, looks_like_article, same_domain, is_allowed_by_robots
+from .utils import extract_links, canon_url, looks_like_article, same_domain, is_allowed_by_robots, client_scope
 
 
 async def _crawl_domain_start(domain: str, client: httpx.AsyncClient, max_pages: int = 30) -> list[dict]:
@@ -15,7 +15,7 @@ async def _crawl_domain_start(domain: str, client: httpx.AsyncClient, max_pages:
     results: list[dict] = []
     for u in seeds:
         try:
-            resp = await client.get(u, headers={"User-Agent": "CerberusAI/1.0"}, timeout=10.0)
+            resp = await client.get(u, headers={"User-Agent": "CerberusAI/1.0"}, timeout=10.0, follow_redirects=True)
             if resp.status_code != 200:
                 continue
             for href, text in extract_links(resp.text, u):
@@ -46,9 +46,9 @@ async def _crawl_domain_start(domain: str, client: httpx.AsyncClient, max_pages:
     return results
 
 
-async def discover(domains: Iterable[str], max_pages_per_domain: int = 30) -> list[dict]:
+async def discover(domains: Iterable[str], max_pages_per_domain: int = 30, client: httpx.AsyncClient | None = None) -> list[dict]:
     results: list[dict] = []
-    async with httpx.AsyncClient(follow_redirects=True) as client:
+    async with client_scope(client) as client:
         tasks = [asyncio.create_task(_crawl_domain_start(d, client, max_pages=max_pages_per_domain)) for d in (domains or [])]
         pages = await asyncio.gather(*tasks, return_exceptions=True)
     seen: set[str] = set()
@@ -7,12 +7,12 @@ from typing import Iterable
 import httpx
 import feedparser  # type: ignore
 
-from .utils import canon_url, within_recency, filter_by_keywords
+from .utils import canon_url, within_recency, keyword_filter, client_scope
 
 
 async def _fetch_feed(url: str, client: httpx.AsyncClient) -> list[dict]:
     try:
-        resp = await client.get(url, headers={"User-Agent": "CerberusAI/1.0"}, timeout=10.0)
+        resp = await client.get(url, headers={"User-Agent": "CerberusAI/1.0"}, timeout=10.0, follow_redirects=True)
         if resp.status_code != 200:
             return []
         parsed = feedparser.parse(resp.text)
@@ -41,12 +41,14 @@ async def discover(
     recency_days: int = 14,
     keyword_include: Iterable[str] | None = None,
     keyword_exclude: Iterable[str] | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> list[dict]:
     results: list[dict] = []
-    async with httpx.AsyncClient(follow_redirects=True) as client:
+    async with client_scope(client) as client:
         tasks = [asyncio.create_task(_fetch_feed(u, client)) for u in (rss_urls or [])]
         pages = await asyncio.gather(*tasks, return_exceptions=True)
     seen: set[str] = set()
+    keep = keyword_filter(keyword_include, keyword_exclude)
     for page in pages:
         if isinstance(page, Exception):
             continue
@@ -61,7 +63,7 @@ async def discover(
                 continue
             if not within_recency(dt, recency_days):
                 continue
-            if not filter_by_keywords(f"{title} {url}", keyword_include, keyword_exclude):
+            if not keep(f"{title} {url}"):
                 continue
             seen.add(key)
             results.append({"url": url, "title": title})
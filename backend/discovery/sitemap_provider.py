@@ -8,7 +8,7 @@ import xml.etree.ElementTree as ET
 
 import httpx
 
-from .utils import canon_url, within_recency, filter_by_keywords
+from .utils import canon_url, within_recency, keyword_filter, client_scope
 
 
 async def _fetch_sitemap(domain: str, client: httpx.AsyncClient) -> list[dict]:
@@ -20,7 +20,7 @@ async def _fetch_sitemap(domain: str, client: httpx.AsyncClient) -> list[dict]:
     ]
     for url in candidates:
         try:
-            resp = await client.get(url, headers={"User-Agent": "CerberusAI/1.0"}, timeout=10.0)
+            resp = await client.get(url, headers={"User-Agent": "CerberusAI/1.0"}, timeout=10.0, follow_redirects=True)
             if resp.status_code != 200 or not resp.text.strip():
                 continue
             return _parse_sitemap_xml(resp.text)
@@ -66,12 +66,14 @@ async def discover(
     recency_days: int = 14,
     keyword_include: Iterable[str] | None = None,
     keyword_exclude: Iterable[str] | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> list[dict]:
-    async with httpx.AsyncClient(follow_redirects=True) as client:
+    async with client_scope(client) as client:
         tasks = [asyncio.create_task(_fetch_sitemap(d, client)) for d in (sitemap_domains or [])]
         pages = await asyncio.gather(*tasks, return_exceptions=True)
     results: list[dict] = []
     seen: set[str] = set()
+    keep = keyword_filter(keyword_include, keyword_exclude)
     for page in pages:
         if isinstance(page, Exception):
             continue
@@ -87,7 +89,7 @@ async def discover(
                 continue
             if not within_recency(dt, recency_days):
                 continue
-            if not filter_by_keywords(f"{title} {url}", keyword_include, keyword_exclude):
+            if not keep(f"{title} {url}"):
                 continue
             seen.add(k)
             results.append({"url": url, "title": title or url})
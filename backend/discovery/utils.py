@@ -1,5 +1,6 @@
 import asyncio
 import re
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from urllib.parse import urljoin, urlparse
 from typing import Iterable
@@ -16,6 +17,16 @@ except Exception:  # pragma: no cover
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) CerberusAI/1.0"
 
 
+@asynccontextmanager
+async def client_scope(client: httpx.AsyncClient | None = None):
+    # Reuse the caller's pooled client when given; otherwise open (and close) a private one
+    if client is not None:
+        yield client
+        return
+    async with httpx.AsyncClient(follow_redirects=True) as own:
+        yield own
+
+
 def canon_url(url: str) -> str:
     try:
         pu = urlparse(url)
@@ -35,16 +46,20 @@ def same_domain(url: str, domain: str) -> bool:
         return False
 
 
+_MEDIA_EXTENSIONS = (
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg",
+    ".mp4", ".mp3", ".avi", ".mov", ".wmv",
+    ".pdf", ".zip", ".rar", ".7z",
+)
+_UTILITY_SEGMENTS = ("/tag/", "/category/", "/page/", "/author/", "/feed")
+
+
 def looks_like_article(url: str) -> bool:
     u = url.lower()
     # Heuristics to avoid media files and utility pages
-    if any(u.endswith(ext) for ext in [
-        ".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg",
-        ".mp4", ".mp3", ".avi", ".mov", ".wmv",
-        ".pdf", ".zip", ".rar", ".7z",
-    ]):
+    if u.endswith(_MEDIA_EXTENSIONS):
         return False
-    if any(seg in u for seg in ["/tag/", "/category/", "/page/", "/author/", "/feed"]):
+    if any(seg in u for seg in _UTILITY_SEGMENTS):
         return False
     return True
 
@@ -58,15 +73,21 @@ def within_recency(dt: datetime | None, days: int) -> bool:
         return True
 
 
-def filter_by_keywords(text: str, include: Iterable[str] | None, exclude: Iterable[str] | None) -> bool:
-    tl = (text or "").lower()
-    if include:
-        if not any(k.lower() in tl for k in include):
+def keyword_filter(include: Iterable[str] | None, exclude: Iterable[str] | None):
+    # Lowercase the keyword lists once; the predicate runs on every feed and sitemap entry and
+    # matches them as case-insensitive substrings of the entry text
+    inc = tuple(k.lower() for k in include or ())
+    exc = tuple(k.lower() for k in exclude or ())
+
+    def matches(text: str) -> bool:
+        tl = (text or "").lower()
+        if inc and not any(k in tl for k in inc):
             return False
-    if exclude:
-        if any(k.lower() in tl for k in exclude):
+        if exc and any(k in tl for k in exc):
             return False
-    return True
+        return True
+
+    return matches
 
 
 _robots_cache: dict[str, tuple[datetime, object]] = {}
@@ -81,7 +102,7 @@ async def is_allowed_by_robots(domain: str, path: str, client: httpx.AsyncClient
         if not rp_rec or (now - rp_rec[0]).total_seconds() > cache_ttl_seconds:
             url = f"https://{domain}/robots.txt"
             try:
-                resp = await client.get(url, headers={"User-Agent": USER_AGENT}, timeout=10.0)
+                resp = await client.get(url, headers={"User-Agent": USER_AGENT}, timeout=10.0, follow_redirects=True)
                 txt = resp.text if resp.status_code == 200 else ""
             except Exception:
                 txt = ""
@@ -102,12 +123,19 @@ async def is_allowed_by_robots(domain: str, path: str, client: httpx.AsyncClient
         return True
 
 
+# Compiled once; the crawler runs these over every seed page it fetches
+_ANCHOR_RE = re.compile(r"<a\s+[^>]*href=\"([^\"]+)\"[^>]*>(.*?)</a>", re.IGNORECASE | re.DOTALL)
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)[^>]*>.*?</\1>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+
 def extract_links(html: str, base_url: str) -> list[tuple[str, str]]:
     # Simple regex-based anchor extraction to avoid extra deps
     results: list[tuple[str, str]] = []
-    for m in re.finditer(r"<a\s+[^>]*href=\"([^\"]+)\"[^>]*>(.*?)</a>", html or "", flags=re.IGNORECASE|re.DOTALL):
+    for m in _ANCHOR_RE.finditer(html or ""):
         href = m.group(1)
-        text = re.sub(r"<[^>]+>", " ", m.group(2) or "").strip()
+        text = _TAG_RE.sub(" ", m.group(2) or "").strip()
         if not href:
             continue
         abs_url = urljoin(base_url, href)
@@ -122,10 +150,9 @@ async def fetch_text(url: str, client: httpx.AsyncClient) -> tuple[str, str | No
             return "", None, resp.status_code
         html = resp.text
         # Strip some heavy sections and tags
-        clean = re.sub(r"(?is)<script[^>]*>.*?</script>", " ", html)
-        clean = re.sub(r"(?is)<style[^>]*>.*?</style>", " ", clean)
-        text = re.sub(r"(?is)<[^>]+>", " ", clean)
-        text = re.sub(r"\s+", " ", text).strip()
+        clean = _SCRIPT_STYLE_RE.sub(" ", html)
+        text = _TAG_RE.sub(" ", clean)
+        text = _WS_RE.sub(" ", text).strip()
         return text, html, 200
     except Exception:
         return "", None, 0
@@ -4,7 +4,6 @@ from fastapi.responses import FileResponse
 
 # main.py
 import os
-import re
 import asyncio
 import httpx
 import logging
@@ -53,6 +52,8 @@ async def startup_event():
     await database.initialize_email_scheduler_db()
     await database.initialize_research_jobs_db()
     await database.initialize_fetch_cache_db()
+    await database.initialize_extraction_cache_db()
+    await database.initialize_page_cache_db(research.PAGE_CACHE_TTL_HOURS, research.PAGE_CACHE_REVALIDATE_HOURS)
     
     # Start the scheduled research executor
     import asyncio
@@ -62,8 +63,10 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """On shutdown, close the httpx client and stop the scheduler."""
+    """On shutdown, flush pending research writes, close the httpx clients and stop the scheduler."""
+    await research.drain_background_tasks()
     await client.aclose()
+    await research.close_http_client()
     scheduler_service.scheduler_executor.stop_scheduler()
     folder_ingest_service.stop()
 
@@ -376,7 +379,7 @@ async def start_research_job(
                 if isinstance(parsed, list):
                     seed_list = [str(u) for u in parsed]
             except Exception:
-                seed_list = [u.strip() for u in re.split(r"[\r\n\s]+", s) if u.strip()]
+                seed_list = s.split()
 
     # initialize SSE queue
     import asyncio as _asyncio
@@ -511,7 +514,7 @@ async def research_endpoint(
                     seed_list = [str(u) for u in parsed]
             except Exception:
                 # Fallback: newline/space separated
-                seed_list = [u.strip() for u in re.split(r"[\r\n\s]+", s) if u.strip()]
+                seed_list = s.split()
 
     # Parse optional config JSON
     job_config = None
@@ -551,6 +554,7 @@ async def get_ollama_servers_endpoint():
 async def add_ollama_server_endpoint(name: str = Form(...), url: str = Form(...)):
     """Adds a new Ollama server configuration."""
     await database.add_ollama_server(name, url)
+    research.invalidate_server_cache()
     return {"message": f"Ollama server '{name}' added successfully."}
 
 @app.delete("/ollama-servers/{name}", status_code=200)
@@ -560,6 +564,7 @@ async def delete_ollama_server_endpoint(name: str):
     if not server:
         raise HTTPException(status_code=404, detail=f"Ollama server '{name}' not found.")
     await database.delete_ollama_server(name)
+    research.invalidate_server_cache()
     return {"message": f"Ollama server '{name}' deleted successfully."}
 
 @app.get("/ollama-servers/{server_name}")
@@ -574,11 +579,13 @@ async def get_ollama_server_by_name_endpoint(server_name: str):
 async def get_ollama_models_endpoint(url: str):
     """Retrieves the list of models available from a given Ollama server URL."""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{url.replace('/api/generate', '')}/api/tags", timeout=10.0)
-            response.raise_for_status()  # Raise an exception for 4xx or 5xx status codes
-            models_data = response.json()
-            return [model['name'] for model in models_data.get('models', [])]
+        # Reuse the app-wide client instead of opening a fresh connection pool per call
+        response = await client.get(f"{url.replace('/api/generate', '')}/api/tags", timeout=10.0)
+        response.raise_for_status()  # Raise an exception for 4xx or 5xx status codes
+        # The same endpoint is the research liveness probe; the next report can skip it
+        research.mark_ollama_healthy(url)
+        models_data = response.json()
+        return [model['name'] for model in models_data.get('models', [])]
     except httpx.RequestError as e:
         raise HTTPException(status_code=500, detail=f"Could not connect to Ollama server: {e}")
     except Exception as e:
@@ -596,6 +603,7 @@ async def get_external_ai_servers_endpoint():
 async def add_external_ai_server_endpoint(name: str = Form(...), type: str = Form(...), api_key: str = Form(...)):
     """Adds a new external AI server configuration."""
     await database.add_external_ai_server(name, type, api_key)
+    research.invalidate_server_cache()
     return {"message": f"External AI server '{name}' added successfully."}
 
 @app.delete("/external-ai-servers/{name}", status_code=200)
@@ -605,6 +613,7 @@ async def delete_external_ai_server_endpoint(name: str):
     if not server:
         raise HTTPException(status_code=404, detail=f"External AI server '{name}' not found.")
     await database.delete_external_ai_server(name)
+    research.invalidate_server_cache()
     return {"message": f"External AI server '{name}' deleted successfully."}
 
 @app.get("/external-ai-servers/{server_name}")
@@ -636,6 +645,15 @@ async def get_research_by_id_endpoint(research_id: int):
         raise HTTPException(status_code=404, detail="Research entry not found.")
     return research_entry
 
+@app.get("/research/{research_id}/sources")
+async def get_research_sources_endpoint(research_id: int):
+    """Retrieves the URLs and titles of the search results a research entry was generated from."""
+    research_entry = await database.get_research_by_id(research_id)
+    if not research_entry:
+        raise HTTPException(status_code=404, detail="Research entry not found.")
+    sources = await database.get_research_sources(research_id)
+    return {"sources": sources}
+
 @app.delete("/research/{research_id}", status_code=200)
 async def delete_research_endpoint(research_id: int):
     """
@@ -768,43 +786,43 @@ async def chat_with_ai_endpoint(
         raise HTTPException(status_code=404, detail=f"AI server '{server_name}' of type '{server_type}' not found.")
 
     try:
-        async with httpx.AsyncClient() as client:
-            if server_type == "ollama":
-                # For Ollama, we need to reconstruct the messages in the format it expects
-                ollama_messages = []
-                for msg in messages_list:
-                    ollama_messages.append({"role": msg['role'], "content": msg['content']})
-                
-                payload = {
-                    "model": model_name,
-                    "messages": ollama_messages,
-                    "stream": False,
-                    "options": {
-                        "num_predict": utils.config.get('llm', {}).get('num_predict', 384)
-                    }
+        # Reuse the module-level client so repeat chats keep their pooled connection
+        if server_type == "ollama":
+            # For Ollama, we need to reconstruct the messages in the format it expects
+            ollama_messages = []
+            for msg in messages_list:
+                ollama_messages.append({"role": msg['role'], "content": msg['content']})
+            
+            payload = {
+                "model": model_name,
+                "messages": ollama_messages,
+                "stream": False,
+                "options": {
+                    "num_predict": utils.config.get('llm', {}).get('num_predict', 384)
                 }
-                async with utils.LLM_SEMAPHORE:
-                    response = await client.post(f"{server_url_or_key.rstrip('/')}/api/chat", json=payload, timeout=180.0)
-                response.raise_for_status()
-                api_response = response.json()
-                processed_text = api_response.get('message', {}).get('content', '')
-
-            elif server_type == "gemini":
-                # For Gemini, we need to send the prompt in its specific format
-                payload = {
-                    "contents": [{
-                        "parts": [{
-                            "text": user_message_content
-                        }]
+            }
+            async with utils.LLM_SEMAPHORE:
+                response = await client.post(f"{server_url_or_key.rstrip('/')}/api/chat", json=payload, timeout=180.0)
+            response.raise_for_status()
+            api_response = response.json()
+            processed_text = api_response.get('message', {}).get('content', '')
+
+        elif server_type == "gemini":
+            # For Gemini, we need to send the prompt in its specific format
+            payload = {
+                "contents": [{
+                    "parts": [{
+                        "text": user_message_content
                     }]
-                }
-                async with utils.LLM_SEMAPHORE:
-                    response = await client.post(f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent?key={server_url_or_key}", json=payload, timeout=180.0)
-                response.raise_for_status()
-                api_response = response.json()
-                processed_text = api_response.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', '')
-            else:
-                raise HTTPException(status_code=400, detail=f"Unsupported server type: {server_type}")
+                }]
+            }
+            async with utils.LLM_SEMAPHORE:
+                response = await client.post(f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent?key={server_url_or_key}", json=payload, timeout=180.0)
+            response.raise_for_status()
+            api_response = response.json()
+            processed_text = api_response.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', '')
+        else:
+            raise HTTPException(status_code=400, detail=f"Unsupported server type: {server_type}")
 
         return {"message": {"content": processed_text}}
 
@@ -821,7 +839,8 @@ async def process_local_storage_query(job_id: str, prompt: str, model_name: str,
     try:
         await database.update_local_storage_job(job_id, 'in_progress')
         
-        combined_content = ""
+        # OCR output per file can be large; collect parts and join once
+        content_parts = []
         for filename in filenames:
             file_path = os.path.join(LOCAL_STORAGE_DIR, filename)
             with open(file_path, "rb") as f:
@@ -832,10 +851,11 @@ async def process_local_storage_query(job_id: str, prompt: str, model_name: str,
                     logging.error(f"Error performing OCR on {filename}: {extracted_text}")
                     # Decide how to handle: skip file, raise error, or include error message
                     # For now, we'll include the error message in combined_content
-                    combined_content += f"[Error performing OCR on {filename}: {extracted_text}]\n\n---\n\n"
+                    content_parts.append(f"[Error performing OCR on {filename}: {extracted_text}]\n\n---\n\n")
                 else:
-                    combined_content += extracted_text
-                    combined_content += "\n\n---\n\n"
+                    content_parts.append(extracted_text)
+                    content_parts.append("\n\n---\n\n")
+        combined_content = "".join(content_parts)
 
         server_details = None
         if server_type == "ollama":
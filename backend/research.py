@@ -1,22 +1,31 @@
 import os
+import asyncio
+import hashlib
 import logging
 import httpx
 from dotenv import load_dotenv
 from langchain_ollama import ChatOllama
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_tavily import TavilySearch
-from serpapi import GoogleSearch
 from typing import Optional
 import json
 import re
 import time
-from datetime import datetime
 import calendar
-from urllib.parse import urlparse
+import functools
+from urllib.parse import urlparse, urlsplit, urlunsplit
 from html import unescape
 import database
 import utils
 
+# orjson (pinned in requirements.txt) parses JSON-LD blocks and LLM replies several times
+# faster than json; both raise ValueError subclasses on malformed input
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -66,20 +75,288 @@ include_domains = [
     "reuters.com"
 ]
 
+# Allowlisted domains as a set; hosts are matched by walking their dot-suffixes (O(labels) hash probes)
+_INCLUDE_DOMAIN_SET = frozenset(include_domains)
+
+def host_in_domains(host: str, domain_set: frozenset) -> bool:
+    parts = (host or "").lower().split(".")
+    return any(".".join(parts[i:]) in domain_set for i in range(len(parts) - 1))
+
+def _is_included_host(host: str) -> bool:
+    return host_in_domains(host, _INCLUDE_DOMAIN_SET)
+
+# Keyword lists are plain substring probes over lowercased text, so "attack" still matches
+# "cyberattacks"; callers lowercase once and test every list against that copy
+def keywords(terms) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(t for t in terms if t))
+
+def contains_any(text: str, terms: tuple[str, ...]) -> bool:
+    return any(k in text for k in terms)
+
+_CANDIDATE_INCIDENT_KW = keywords([
+    "ransomware", "data breach", "breach", "cyberattack", "attack",
+    "leak", "exfiltration", "ddos", "exploit", "vulnerability", "malware"
+])
+_SECOND_PASS_INCIDENT_KW = keywords([
+    "ransomware", "phishing", "ddos", "exploit", "vulnerability", "data breach", "cyberattack", "breach", "leak", "malware"
+])
+_DOMAIN_PASS_KW = keywords([
+    "australia", "australian", "ransomware", "phishing", "ddos", "exploit", "vulnerability", "data breach", "cyberattack", "breach", "leak"
+])
+_RELEVANCE_DEFAULT = "Relevant to Australian businesses due to potential impact on similar industries or supply chains"
+_RELEVANCE_PIPEMAGIC = (
+    "Shows attackers rapidly weaponizing new Microsoft zero-days for ransomware. "
+    "Highlights that Australian businesses must apply security updates immediately; "
+    "any unpatched Windows servers could be hijacked via PipeMagic as soon as patches are released"
+)
+# The raw HTML isn't lowercased, so the CVE id is matched case-insensitively there
+_PIPEMAGIC_CVE_RE = re.compile(r"cve-2025-29824", re.IGNORECASE)
+
+# Sector tiers checked in order against the lowercased text: (keyword, extended-only, message)
+_RELEVANCE_SECTOR_RULES = (
+    ("government", False, "Affects Australian government operations and public sector data security."),
+    ("superannuation", True, "Impacts Australia’s superannuation industry, critical for financial security."),
+    ("university", False, "Impacts Australian educational institutions, affecting data security and operations."),
+)
+
+# Relevance message for one article from substring probes over one lowercased copy.
+# `extended` adds the Qantas/superannuation/Australia tiers used for primary (LLM-extracted) results.
+def _classify_relevance(title: str, content: str, targets: str = "", raw_html: str | None = None, extended: bool = True) -> str:
+    tlc = title.lower()
+    clc = content.lower()
+    # Specific relevance for Microsoft PipeMagic zero-day (CVE-2025-29824)
+    if (
+        "pipemagic" in tlc or "pipemagic" in clc or "cve-2025-29824" in clc or "clfs" in clc or
+        (extended and raw_html and _PIPEMAGIC_CVE_RE.search(raw_html))
+    ):
+        return _RELEVANCE_PIPEMAGIC
+    # Trigger direct Qantas impact only when in title or targets
+    if extended and "qantas" in (tlc + " " + targets.lower()):
+        return "Directly impacts Qantas, a major Australian airline, affecting customer trust and compliance."
+    for keyword, extended_only, message in _RELEVANCE_SECTOR_RULES:
+        if keyword in clc and (extended or not extended_only):
+            return message
+    # "australian sectors" contains "australia", so one (case-sensitive, as before) probe covers both
+    if extended and "australia" in content:
+        return "Impacts Australian businesses across multiple sectors, increasing cybersecurity risks."
+    return _RELEVANCE_DEFAULT
+
+# Incident / non-incident classification keywords used by format_raw_results
+_INCIDENT_KW = keywords([
+    "breach", "attack", "ransomware", "extortion", "data leak", "leaked",
+    "hacked", "cyberattack", "intrusion", "compromise", "outage"
+])
+_NON_INCIDENT_KW = keywords([
+    "op-ed", "op ed", "opinion", "analysis", "predictions", "awareness month",
+    "legislation", "act passed", "bill", "law", "aggregator", "roundup", "round-up",
+    "rules", "policy", "regulation", "regulatory", "report", "trends", "trend report",
+    "awareness", "election", "strategy", "framework", "act", "legislation",
+    "list of", "complete list", "notifications", "notification", "digest", "weekly",
+    "monthly", "annual", "what we know", "explainer", "guide", "webinar", "register",
+    "sign up", "panel", "roundtable", "fireside", "forecast", "landscape", "overview",
+    "top ransomware groups", "battle", "what to expect"
+])
+# Titles that read as lists/overviews rather than a single incident
+_OVERVIEW_TITLE_KW = keywords(["top ", "landscape", "trends", "webinar", "overview", "battle", "threats in"])
+# Annual/quarterly reports, NDB summaries, lists and digests are never discrete incidents
+_HARD_EXCLUDE_KW = keywords([
+    "annual cyber threat report", "annual report", "quarterly report",
+    "notifiable data breaches", "data breach notifications", "list of data breaches",
+    "complete list", "roundup", "round-up", "digest", "newsletter"
+])
+
+# Line-oriented fields of the LLM extraction response, matched by prefix at the start of a line;
+# values stay on the field's own line, so a blank field can't swallow the next "Field:" line
+_LINE_FIELD_PREFIXES = (
+    ("Summary:", "summary"), ("Date of Incident:", "date"), ("Targets:", "targets"),
+    ("Method:", "method"), ("Exploit Used:", "exploit"),
+)
+_INCIDENT_FIELD_MARKER = "incident?:"
+
+def _json_field(data: dict, key: str) -> str | None:
+    if key not in data:
+        return None
+    v = data[key]
+    if v is None:
+        return ""
+    if isinstance(v, list):
+        return ", ".join(str(x) for x in v if x)
+    return str(v)
+
+# Extraction responses are JSON objects; line-oriented "Field: value" text (older cache
+# entries, or a model that ignored the format) is still accepted. Missing fields are None.
+def _parse_extraction(text: str) -> dict:
+    start, end = text.find("{"), text.rfind("}")
+    if start != -1 and end > start:
+        try:
+            data = json_loads(text[start:end + 1])
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            incident = data.get("incident")
+            if isinstance(incident, str):
+                incident = incident.strip().lower() in ("yes", "true")
+            return {
+                "summary": _json_field(data, "summary"),
+                "date": _json_field(data, "date_of_incident"),
+                "targets": _json_field(data, "targets"),
+                "method": _json_field(data, "method"),
+                "exploit": _json_field(data, "exploit_used"),
+                "incident": incident is True,
+            }
+    # One pass over the lines; the first occurrence of each field wins
+    fields = dict.fromkeys(key for _, key in _LINE_FIELD_PREFIXES)
+    incident = None
+    for line in text.splitlines():
+        for prefix, key in _LINE_FIELD_PREFIXES:
+            if line.startswith(prefix):
+                if fields[key] is None:
+                    fields[key] = line[len(prefix):].lstrip(" \t")
+                break
+        if incident is None:
+            pos = line.lower().find(_INCIDENT_FIELD_MARKER)
+            if pos != -1:
+                answer = line[pos + len(_INCIDENT_FIELD_MARKER):].lstrip(" \t")[:3].lower()
+                if answer.startswith("yes"):
+                    incident = True
+                elif answer.startswith("no"):
+                    incident = False
+    fields["incident"] = incident is True
+    return fields
+
+def _batch_items(data) -> list | None:
+    # Article entries of a batched reply: {"articles": [...]} or a bare list
+    items = data.get("articles") if isinstance(data, dict) else data
+    return items if isinstance(items, list) else None
+
+def _split_batch_extraction(text: str, count: int) -> list[str | None]:
+    # Per-article JSON objects from a batched extraction, matched on their "article" number;
+    # None where the model dropped or garbled an entry so the caller can retry that one alone
+    out: list[str | None] = [None] * count
+    text = (text or "").strip()
+    try:
+        items = _batch_items(json_loads(text))
+    except ValueError:
+        # Prose or ```json fences around the payload: try the outermost {"articles": [...]} object
+        # and the outermost bare list, whichever opens first ("[{...}]" also holds an object span)
+        items = None
+        spans = sorted((text.find(open_ch), close_ch) for open_ch, close_ch in (("{", "}"), ("[", "]")))
+        for start, close_ch in spans:
+            end = text.rfind(close_ch)
+            if start == -1 or end <= start:
+                continue
+            try:
+                items = _batch_items(json_loads(text[start:end + 1]))
+            except ValueError:
+                continue
+            if items is not None:
+                break
+    if items is None:
+        return out
+    for pos, item in enumerate(items):
+        if not isinstance(item, dict):
+            continue
+        try:
+            idx = int(item.get("article")) - 1
+        except (TypeError, ValueError):
+            idx = pos
+        if 0 <= idx < count and out[idx] is None:
+            out[idx] = json.dumps(item)
+    return out
+
+# Block-level tags delimit the text runs of a page. Page text keeps every run, one per line, so
+# standalone dates, bylines and short headings still reach the date and keyword heuristics; only
+# the prompt drops runs of four words or fewer (menus, buttons, share widgets; see _prompt_prose)
+_BLOCK_TAG_RE = re.compile(r"(?i)</?(?:p|div|li|ul|ol|br|h[1-6]|tr|td|th|section|article|aside|blockquote|figure|figcaption|form|button)\b[^>]*>")
+_ANY_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+PROMPT_MIN_WORDS_PER_BLOCK = 5
+
+def _extract_blocks(html: str) -> str:
+    blocks = []
+    for block in _BLOCK_TAG_RE.split(html):
+        text = _WS_RE.sub(" ", unescape(_ANY_TAG_RE.sub(" ", block))).strip()
+        if text:
+            blocks.append(text)
+    return "\n".join(blocks)
+
+def _prompt_prose(text: str) -> str:
+    # Article prose for the LLM prompt: the page-text runs long enough to be sentences. Snippets
+    # and other single-run text pass through whole
+    prose = " ".join(line for line in text.split("\n") if len(line.split()) >= PROMPT_MIN_WORDS_PER_BLOCK)
+    return prose or text
+
+_FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+}
+
+# lxml (already required by readability-lxml) parses pages in C; the regex path below is the fallback
+try:
+    import lxml.html
+    from lxml import etree
+    _LXML_AVAILABLE = True
+except ImportError:
+    _LXML_AVAILABLE = False
+
+_BOILERPLATE_TAGS = ("script", "style", "nav", "header", "footer")
+_PROSE_BLOCK_TAGS = frozenset((
+    "p", "div", "li", "ul", "ol", "br", "h1", "h2", "h3", "h4", "h5", "h6", "tr", "td", "th",
+    "section", "article", "aside", "blockquote", "figure", "figcaption", "form", "button",
+))
+_BLOCK_BREAK = "\x00"
+
+def _html_to_text_lxml(html: str) -> str:
+    root = lxml.html.fromstring(html)
+    etree.strip_elements(root, *_BOILERPLATE_TAGS, with_tail=False)
+    # Mark block boundaries (same tags _BLOCK_TAG_RE splits on) so one text_content() pass yields the runs
+    for el in root.iter(*_PROSE_BLOCK_TAGS):
+        el.text = _BLOCK_BREAK + (el.text or "")
+        el.tail = _BLOCK_BREAK + (el.tail or "")
+    blocks = []
+    for block in root.text_content().split(_BLOCK_BREAK):
+        words = block.split()
+        if words:
+            blocks.append(" ".join(words))
+    return "\n".join(blocks)
+
+# Scripts/styles and common boilerplate containers, stripped in a single scan of the page
+_BOILERPLATE_BLOCK_RE = re.compile(r"<(script|style|nav|header|footer)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+
+def html_to_text(html: str) -> str:
+    if _LXML_AVAILABLE and html and html.strip():
+        try:
+            return _html_to_text_lxml(html)
+        except (etree.ParserError, ValueError) as e:
+            # Empty documents and str input carrying an XML encoding declaration
+            logger.debug("lxml parse failed, using regex strip: %s", e)
+    # Strip scripts/styles and common boilerplate tags
+    html = _BOILERPLATE_BLOCK_RE.sub(" ", html)
+    # Drop tags, one line per block run
+    return _extract_blocks(html)
+
+MONTH_NAMES = ("January", "February", "March", "April", "May", "June",
+                "July", "August", "September", "October", "November", "December")
+_MONTH_ABBRS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+# Capitalized month name/abbreviation -> month number
+_MONTH_NUMBERS = {name: i for i, name in enumerate(MONTH_NAMES, start=1)}
+_MONTH_ABBR_NUMBERS = {**{abbr: i for i, abbr in enumerate(_MONTH_ABBRS, start=1)}, "Sept": 9}
+
+_QUERY_ISO_RANGE_RE = re.compile(r'from\s+(\d{4}-\d{2}-\d{2})\s+to\s+(\d{4}-\d{2}-\d{2})', re.IGNORECASE)
+_QUERY_MONTH_RANGE_RE = re.compile(r'from\s+([A-Za-z]+)\s+(\d{4})\s+to\s+([A-Za-z]+)\s+(\d{4})', re.IGNORECASE)
+
 # Extract date range (YYYY-MM-DD) from the query string
 def _parse_date_range_from_query(q: str):
     if not q:
         return None, None
     # from YYYY-MM-DD to YYYY-MM-DD
-    m = re.search(r'from\s+(\d{4}-\d{2}-\d{2})\s+to\s+(\d{4}-\d{2}-\d{2})', q, re.IGNORECASE)
+    m = _QUERY_ISO_RANGE_RE.search(q)
     if m:
         return m.group(1), m.group(2)
     # from Month YYYY to Month YYYY -> first/last day of months
-    m = re.search(r'from\s+([A-Za-z]+)\s+(\d{4})\s+to\s+([A-Za-z]+)\s+(\d{4})', q, re.IGNORECASE)
+    m = _QUERY_MONTH_RANGE_RE.search(q)
     if m:
-        months = {m: i for i, m in enumerate(["January","February","March","April","May","June","July","August","September","October","November","December"], start=1)}
-        sm = months.get(m.group(1).capitalize())
-        em = months.get(m.group(3).capitalize())
+        sm = _MONTH_NUMBERS.get(m.group(1).capitalize())
+        em = _MONTH_NUMBERS.get(m.group(3).capitalize())
         sy = int(m.group(2)); ey = int(m.group(4))
         if sm and em:
             start = f"{sy:04d}-{sm:02d}-01"
@@ -104,8 +381,39 @@ def _normalize_serpapi_results(resp: dict) -> dict:
         })
     return {"results": results}
 
-# Primary search via SERPAPI (Google) with AU preference
-def _search_serpapi(query: str, num: int = 50, gl: str = "au", hl: str = "en", extra_params: Optional[dict] = None) -> dict:
+# Search responses memoized for SEARCH_CACHE_TTL_S, keyed on the stable request parameters. The
+# "timestamp:<epoch>" nonce perform_search appends is still sent upstream but ignored in the key.
+SEARCH_CACHE_TTL_S = 900
+SEARCH_CACHE_MAX_ENTRIES = 256
+_search_cache: dict[tuple, tuple[float, dict]] = {}
+_QUERY_NONCE_RE = re.compile(r"\s*timestamp:\d+")
+
+def _search_cache_get(key: tuple) -> dict | None:
+    entry = _search_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        _search_cache.pop(key, None)
+        return None
+    # Fresh list per caller so extending/filtering it never touches the cached copy
+    return {**entry[1], "results": list(entry[1].get("results") or [])}
+
+def _search_cache_put(key: tuple, value: dict):
+    # Empty responses (quota errors, outages) are not worth pinning for the TTL
+    if not value or not value.get("results"):
+        return
+    if len(_search_cache) >= SEARCH_CACHE_MAX_ENTRIES:
+        _search_cache.pop(next(iter(_search_cache)), None)
+    _search_cache[key] = (time.monotonic() + SEARCH_CACHE_TTL_S, value)
+
+_SERPAPI_ENDPOINT = "https://serpapi.com/search.json"
+
+# Primary search via SERPAPI (Google) with AU preference; native coroutine on the shared client
+async def _search_serpapi(query: str, num: int = 50, gl: str = "au", hl: str = "en", extra_params: Optional[dict] = None) -> dict:
+    cache_key = ("serpapi", _QUERY_NONCE_RE.sub("", query), num, gl, hl, json.dumps(extra_params or {}, sort_keys=True, default=str))
+    cached = _search_cache_get(cache_key)
+    if cached is not None:
+        return cached
     params = {
         "engine": "google",
         "q": query,
@@ -116,29 +424,340 @@ def _search_serpapi(query: str, num: int = 50, gl: str = "au", hl: str = "en", e
     }
     if extra_params:
         params.update({k: v for k, v in extra_params.items() if v is not None})
-    search = GoogleSearch(params)
-    resp = search.get_dict()
-    return _normalize_serpapi_results(resp)
+    # num=100 pages can take well over the pool's 10s read timeout
+    resp = await get_http_client().get(_SERPAPI_ENDPOINT, params=params, timeout=30.0)
+    data = resp.json()
+    if data.get("error"):
+        logger.warning("SERPAPI returned an error: %s", data["error"])
+    normalized = _normalize_serpapi_results(data)
+    _search_cache_put(cache_key, normalized)
+    return normalized
+
+# TavilySearch tools cached per (max_results, include_domains) so the client and its session are reused
+_tavily_tools: dict[tuple[int, tuple[str, ...] | None], TavilySearch] = {}
+
+def _get_tavily_tool(max_results: int = 50, include_domains_list=None) -> TavilySearch:
+    key = (max_results, tuple(include_domains_list) if include_domains_list else None)
+    tool = _tavily_tools.get(key)
+    if tool is None:
+        tool = _tavily_tools.setdefault(key, TavilySearch(
+            max_results=max_results,
+            topic="general",
+            search_depth="advanced",
+            include_domains=include_domains_list or None,
+        ))
+    return tool
 
 # Fallback search via Tavily
-def _search_tavily(query: str, max_results: int = 50, include_domains_list=None) -> dict:
-    t = TavilySearch(
-        max_results=max_results,
-        topic="general",
-        search_depth="advanced",
-        include_domains=include_domains_list or None,
-    )
-    results = t.invoke(query)
+async def _search_tavily(query: str, max_results: int = 50, include_domains_list=None) -> dict:
+    cache_key = ("tavily", _QUERY_NONCE_RE.sub("", query), max_results, tuple(include_domains_list) if include_domains_list else None)
+    cached = _search_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    results = await _get_tavily_tool(max_results, include_domains_list).ainvoke(query)
+    if isinstance(results, dict):
+        _search_cache_put(cache_key, results)
     return results
 
+# HTTP/2 lets same-host article fetches share one connection; httpx needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Shared async HTTP client (keep-alive pool reused across requests; closed on app shutdown)
+_http_client: httpx.AsyncClient | None = None
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
+    return _http_client
+
+async def read_page_capped(resp: httpx.Response) -> str:
+    # Stop reading at MAX_PAGE_BYTES: the article body and its metadata sit well
+    # inside that, the rest is comments, related-story rails and inline bundles
+    chunks = []
+    received = 0
+    async for chunk in resp.aiter_bytes():
+        chunks.append(chunk)
+        received += len(chunk)
+        if received >= MAX_PAGE_BYTES:
+            break
+    return b"".join(chunks)[:MAX_PAGE_BYTES].decode(resp.encoding or "utf-8", errors="replace")
+
+async def close_http_client():
+    """Closes the shared HTTP client, if it was created."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+# Ollama liveness probe, cached per server URL so healthy servers aren't re-probed on every query
+OLLAMA_HEALTH_TTL_S = float(utils.config.get('llm', {}).get('health_ttl_s', 60))
+_ollama_healthy_until: dict[str, float] = {}
+
+def _ollama_base_url(server_url: str) -> str:
+    return server_url.replace('/api/generate', '').rstrip('/')
+
+def mark_ollama_healthy(server_url: str):
+    """Records a successful /api/tags response (e.g. the UI's model list) as a fresh liveness probe."""
+    _ollama_healthy_until[_ollama_base_url(server_url)] = time.monotonic() + OLLAMA_HEALTH_TTL_S
+
+# Probes in flight per server: searches that start together on a cold (or expired) entry share one
+# /api/tags request instead of each sending their own
+_ollama_probes: dict[str, asyncio.Future] = {}
+
+def _discard_task(task: asyncio.Task | None):
+    # Cancel a helper task whose result is no longer wanted; a finished one has its exception
+    # retrieved so asyncio doesn't log "Task exception was never retrieved"
+    if task is None:
+        return
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+async def _check_ollama_server(server_url: str):
+    base_url = _ollama_base_url(server_url)
+    if _ollama_healthy_until.get(base_url, 0.0) > time.monotonic():
+        return
+    probe = _ollama_probes.get(base_url)
+    if probe is None:
+        probe = asyncio.ensure_future(_probe_ollama_server(base_url, server_url))
+        _ollama_probes[base_url] = probe
+
+        def _probe_done(task: asyncio.Future):
+            _ollama_probes.pop(base_url, None)
+            # Mark the outcome retrieved even if every waiter was cancelled
+            if not task.cancelled():
+                task.exception()
+
+        probe.add_done_callback(_probe_done)
+    # Shielded so one cancelled search doesn't cancel the probe the others are waiting on
+    await asyncio.shield(probe)
+
+async def _probe_ollama_server(base_url: str, server_url: str):
+    try:
+        response = await get_http_client().get(f"{base_url}/api/tags", timeout=3.0)
+    except httpx.HTTPError as e:
+        _ollama_healthy_until.pop(base_url, None)
+        raise ConnectionError(f"Failed to connect to Ollama server at {server_url}: {e}") from e
+    if response.status_code != 200:
+        _ollama_healthy_until.pop(base_url, None)
+        raise ConnectionError(f"Failed to connect to Ollama server at {server_url}")
+    mark_ollama_healthy(base_url)
+
+# Fire-and-forget persistence: strong refs keep tasks alive until done; drained on app shutdown
+_background_tasks: set[asyncio.Task] = set()
+
+def _on_background_done(task: asyncio.Task):
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background research write failed: %s", task.exception())
+
+def _spawn_background(coro):
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_done)
+    return task
+
+async def drain_background_tasks():
+    """Waits for pending background writes (e.g. research results) to finish."""
+    if _background_tasks:
+        await asyncio.gather(*list(_background_tasks), return_exceptions=True)
+
+# Server rows resolved per (server_type, server_name); short TTL plus explicit invalidation on add/delete
+SERVER_CACHE_TTL_S = 30
+_server_cache: dict[tuple[str, str | None], tuple[dict, float]] = {}
+
+async def _resolve_server(server_type: str, server_name: str | None) -> dict:
+    key = (server_type, server_name)
+    now = time.monotonic()
+    cached = _server_cache.get(key)
+    if cached and cached[1] > now:
+        return cached[0]
+    if server_type == "ollama":
+        get_by_name, get_all, label = database.get_ollama_server_by_name, database.get_ollama_servers, "Ollama"
+    else:
+        get_by_name, get_all, label = database.get_external_ai_server_by_name, database.get_external_ai_servers, "Gemini"
+    selected = await get_by_name(server_name) if server_name else None
+    if not selected:
+        all_servers = await get_all()
+        if not all_servers:
+            raise ValueError(f"No {label} servers configured.")
+        selected = all_servers[0]
+    _server_cache[key] = (selected, now + SERVER_CACHE_TTL_S)
+    return selected
+
+def invalidate_server_cache():
+    """Drops cached server selections; call after servers are added or removed."""
+    _server_cache.clear()
+
+# ChatOllama clients cached per (base_url, model) so the underlying HTTP pool stays warm across queries
+_ollama_llm_cache: dict[tuple[str, str], ChatOllama] = {}
+
+def get_ollama_llm(base_url: str, model_name: str) -> ChatOllama:
+    key = (base_url, model_name)
+    llm = _ollama_llm_cache.get(key)
+    if llm is None:
+        llm = _ollama_llm_cache.setdefault(key, ChatOllama(
+            model=model_name,
+            temperature=0,
+            num_ctx=OLLAMA_NUM_CTX,
+            api_key=os.environ.get("OPENROUTER_API_KEY"),
+            base_url=base_url
+        ))
+    return llm
+
+# Gemini clients cached per API key for the same reason (one model is used for every Gemini call)
+GEMINI_MODEL = "models/gemini-2.5-flash"
+_gemini_llm_cache: dict[str, ChatGoogleGenerativeAI] = {}
+
+def get_gemini_llm(api_key: str) -> ChatGoogleGenerativeAI:
+    llm = _gemini_llm_cache.get(api_key)
+    if llm is None:
+        llm = _gemini_llm_cache.setdefault(api_key, ChatGoogleGenerativeAI(
+            model=GEMINI_MODEL,
+            temperature=0,
+            google_api_key=api_key
+        ))
+    return llm
+
+# Content-addressed key for cached LLM extractions (same model + same article text => same output at temperature 0)
+def extraction_cache_key(model_name: str, content: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_EXTRACTION_PROMPT_TAG)
+    h.update(b"\0")
+    h.update((model_name or "").encode("utf-8"))
+    h.update(b"\0")
+    h.update((content or "").encode("utf-8", "ignore"))
+    return h.hexdigest()
+
+# Near-duplicate detection for syndicated articles: word 5-gram shingle sets compared by Jaccard.
+# A dependency-free stand-in for an embedding index at the scale of one report.
+def shingle_signature(text: str, n: int = 5) -> frozenset:
+    words = _WS_RE.split((text or "").lower().strip())
+    if len(words) <= n:
+        return frozenset([" ".join(words)])
+    return frozenset(hash(tuple(words[i:i + n])) for i in range(len(words) - n + 1))
+
+def shingle_similarity(a: frozenset, b: frozenset) -> float:
+    # Jaccard similarity of two shingle sets. A short page whose text sits inside a longer roundup
+    # scores low here (its shingles are a small share of the union), so it never borrows the
+    # roundup's extraction; syndicated copies of one story still score near 1
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+def truncate_for_prompt(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    # Cut on a word boundary so the model never sees a split token at the end
+    return text[:limit].rsplit(" ", 1)[0]
+
+# Host prefixes that serve the same article as the bare domain
+_MIRROR_HOST_PREFIXES = ("www.", "amp.", "m.", "mobile.")
+
+# Memoized by URL string: the filter, both dedupe passes and the backfill all key on it, and the
+# result dicts themselves are shared with the search cache, so nothing is written onto them
+@functools.lru_cache(maxsize=4096)
+def _canonicalize_url(url: str) -> str:
+    # Dedupe key: host + path. Scheme, host case, mirror subdomains, query strings (tracking
+    # parameters), fragments, trailing slashes and AMP path suffixes don't make a different
+    # article; path case does on many CMSs, so the path is kept as given
+    raw = (url or "").strip()
+    try:
+        pu = urlparse(raw)
+    except ValueError:
+        return raw.rstrip("/")
+    host = pu.hostname or ""  # urlparse lowercases the hostname
+    for prefix in _MIRROR_HOST_PREFIXES:
+        if host.startswith(prefix) and "." in host[len(prefix):]:
+            host = host[len(prefix):]
+            break
+    path = pu.path.rstrip("/")
+    if path.endswith("/amp"):
+        path = path[:-4]
+    return f"{host}{path}"
+
+def _page_cache_key(url: str) -> str:
+    # page_cache and per-report fetch key: the URL the server is sent, with only the scheme and
+    # host lowercased and the fragment dropped. Unlike the dedupe key it keeps the query string
+    # and path case, which can select a different article
+    raw = (url or "").strip()
+    try:
+        pu = urlsplit(raw)
+    except ValueError:
+        return raw
+    if not pu.scheme or not pu.netloc:
+        return raw
+    return urlunsplit((pu.scheme.lower(), pu.netloc.lower(), pu.path, pu.query, ""))
+
+def _result_canon(result: dict) -> str:
+    return _canonicalize_url(result.get("url"))
+
+def _canon_host(canon: str) -> str:
+    return canon.split("/", 1)[0]
+
 # Config-driven limits
 _limits_cfg = utils.config.get('research_limits', {})
 MAX_RESULTS_TO_ANALYZE = _limits_cfg.get('max_results_to_analyze', 12)
 MAX_ARTICLE_CHARS = _limits_cfg.get('max_article_chars', 4000)
+# Article text embedded in the extraction prompt (~4 chars/token, so 3000 chars is roughly 750 tokens);
+# the lead carries the incident facts, the full text is still used for keyword/date heuristics
+MAX_PROMPT_CHARS = _limits_cfg.get('max_prompt_chars', 3000)
+# Below this the extraction can only come back "Not specified", so the LLM call is skipped
+MIN_EXTRACTION_CHARS = _limits_cfg.get('min_extraction_chars', 80)
 TARGET_MIN_RESULTS = _limits_cfg.get('target_min_results', MAX_RESULTS_TO_ANALYZE)
+# Article pages fetched at once per report, and the wall-clock cap on any single fetch
+PAGE_FETCH_CONCURRENCY = max(1, int(_limits_cfg.get('page_fetch_concurrency', 8)))
+PAGE_FETCH_DEADLINE_S = _limits_cfg.get('page_fetch_deadline_s', 15)
+# Use a rich search snippet as the article text instead of fetching the page (see _is_rich_snippet)
+SKIP_FETCH_WHEN_SNIPPET_RICH = bool(_limits_cfg.get('skip_fetch_when_snippet_rich', True))
+# Shingle similarity (Jaccard) at which two articles in one report share a single LLM extraction
+NEAR_DUPLICATE_SIMILARITY = float(_limits_cfg.get('near_duplicate_similarity', 0.8))
+# Raw HTML read per article page before the download is cut off
+MAX_PAGE_BYTES = int(_limits_cfg.get('max_page_bytes', 512 * 1024))
+# How long a fetched article page is reused from the page_cache table
+PAGE_CACHE_TTL_HOURS = _limits_cfg.get('page_cache_ttl_hours', 24)
+# How long an expired page with an ETag/Last-Modified is kept for a conditional (304) refetch
+PAGE_CACHE_REVALIDATE_HOURS = _limits_cfg.get('page_cache_revalidate_hours', 168)
+# Cache-miss articles sent to the LLM per extraction prompt; 1 restores one call per article
+EXTRACTION_BATCH_SIZE = max(1, int(_limits_cfg.get('extraction_batch_size', 4)))
+# Ollama's default 2048-token window silently drops the front of a longer prompt, so size it for a
+# full extraction batch: each article's excerpt and JSON answer plus the shared preamble, in 1K steps
+OLLAMA_NUM_CTX = -(-(EXTRACTION_BATCH_SIZE * (MAX_PROMPT_CHARS // 4 + 256) + 1024) // 1024) * 1024
 # Enforce at least 10, or the configured target if higher
 MIN_RESULTS_ENFORCED = max(TARGET_MIN_RESULTS, 10)
 
+# Field spec shared by the single and batched extraction prompts
+_EXTRACTION_KEYS = '''"summary": one sentence,
+"date_of_incident": YYYY-MM-DD or natural date,
+"targets": entities,
+"method": one of [Ransomware, Phishing, Data breach, DDoS, Vulnerability exploitation, Supply chain compromise, Credential stuffing, Business email compromise, Vishing, Malware/Backdoor, Espionage],
+"exploit_used": CVE IDs and/or exploit mechanism,
+"incident": true only if a specific incident is described; false for op-eds, legislation, awareness months, and aggregator pages'''
+# Fixed instructions that open every extraction prompt, single or batched. Nothing request-specific
+# comes before the article text, so Ollama's KV-cache reuse and Gemini's implicit prefix caching
+# skip re-processing these tokens on consecutive calls
+_EXTRACTION_PREAMBLE = f'''You are a cybersecurity analyst extracting discrete incident details.
+Describe each article with a JSON object holding exactly these keys:
+{_EXTRACTION_KEYS}
+
+Treat every article independently. If you cannot determine a field from an article, use an empty string.
+'''
+# Bump when the prompt wording changes. Version, field spec and prompt size are part of every
+# extraction cache key, so replies to an older prompt are never served for the current one
+EXTRACTION_PROMPT_VERSION = 3
+_EXTRACTION_PROMPT_TAG = f"v{EXTRACTION_PROMPT_VERSION}:{MAX_PROMPT_CHARS}:{_EXTRACTION_PREAMBLE}".encode("utf-8")
+
 # Function to perform a search
 async def perform_search(query, server_name: str = None, model_name: str = "granite3.3", server_type: str = "ollama", seed_urls: list | None = None, focus_on_seed: bool = True):
     """
@@ -162,41 +781,13 @@ async def perform_search(query, server_name: str = None, model_name: str = "gran
         server_url_or_key = None
 
         if server_type == "ollama":
-            if server_name:
-                selected_server = await database.get_ollama_server_by_name(server_name)
-            if not selected_server:
-                all_servers = await database.get_ollama_servers()
-                if all_servers:
-                    selected_server = all_servers[0]
-                else:
-                    raise ValueError("No Ollama servers configured.")
+            selected_server = await _resolve_server("ollama", server_name)
             server_url_or_key = selected_server['url']
-            llm = ChatOllama(
-                model=model_name,
-                temperature=0,
-                api_key=os.environ.get("OPENROUTER_API_KEY"),
-                base_url=server_url_or_key.replace("/api/generate", "/")
-            )
-            # Test connection to the selected Ollama server using async HTTP client
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{server_url_or_key.replace('/api/generate', '')}/api/tags")
-                if response.status_code != 200:
-                    raise ConnectionError(f"Failed to connect to Ollama server at {server_url_or_key}")
+            llm = get_ollama_llm(server_url_or_key.replace("/api/generate", "/"), model_name)
         elif server_type == "gemini":
-            if server_name:
-                selected_server = await database.get_external_ai_server_by_name(server_name)
-            if not selected_server:
-                all_servers = await database.get_external_ai_servers()
-                if all_servers:
-                    selected_server = all_servers[0]
-                else:
-                    raise ValueError("No Gemini servers configured.")
+            selected_server = await _resolve_server("gemini", server_name)
             server_url_or_key = selected_server['api_key']
-            llm = ChatGoogleGenerativeAI(
-                model=f"models/gemini-2.5-flash",
-                temperature=0,
-                google_api_key=server_url_or_key
-            )
+            llm = get_gemini_llm(server_url_or_key)
         else:
             raise ValueError(f"Unsupported server type: {server_type}")
 
@@ -205,167 +796,134 @@ async def perform_search(query, server_name: str = None, model_name: str = "gran
             query = f"{query} Australia cybersecurity incidents timestamp:{int(time.time())}"
         # Extract date range from the query (used later for filtering and for a second-pass query)
         range_start, range_end = _parse_date_range_from_query(query)
-        logger.info(f"Processing query: {query}")
+        logger.debug("Processing query: %s", query)
         
-        # Get raw results: SERPAPI primary (prefer news), Tavily fallback
-        import asyncio
-        raw_results = {"results": []}
+        # Probe the Ollama server (cached for OLLAMA_HEALTH_TTL_S) while the search APIs are in flight
+        health_task = asyncio.create_task(_check_ollama_server(server_url_or_key)) if server_type == "ollama" else None
 
-        # Seed-mode: focus on explicit URLs when provided
-        if seed_urls:
-            try:
-                # Normalize list of URLs
-                seeds = []
-                for u in seed_urls:
-                    u = (u or "").strip()
-                    if not u:
-                        continue
-                    seeds.append({"url": u, "title": u, "content": ""})
-                raw_results["results"] = seeds
-                logger.info(f"Seed URL mode: {len(seeds)} URLs provided")
-            except Exception as e:
-                logger.warning(f"Failed to prepare seed URLs: {e}")
+        try:
+            # Get raw results: SERPAPI primary (prefer news), Tavily fallback
+            raw_results = {"results": []}
 
-        # If not focusing only on seeds, augment with search results
-        if (not focus_on_seed) or (not seed_urls):
-            try:
-                if serpapi_api_key:
-                    extra = {"tbm": "nws"}
-                    if range_start and range_end:
-                        extra["tbs"] = f"cdr:1,cd_min:{range_start},cd_max:{range_end}"
-                    sr = await asyncio.get_event_loop().run_in_executor(None, _search_serpapi, query, 100, "au", "en", extra)
-                    logger.info("Raw SERPAPI results retrieved")
-                    raw_results["results"].extend(sr.get("results", []))
-            except Exception as e:
-                logger.warning(f"SERPAPI search failed, will try Tavily fallback: {e}")
-            if tavily_api_key:
+            # Seed-mode: focus on explicit URLs when provided
+            if seed_urls:
                 try:
-                    tr = await asyncio.get_event_loop().run_in_executor(None, _search_tavily, query, 50, include_domains)
-                    logger.info("Raw Tavily results retrieved (fallback)")
-                    raw_results["results"].extend(tr.get("results", []))
+                    # Normalize list of URLs
+                    seeds = []
+                    for u in seed_urls:
+                        u = (u or "").strip()
+                        if not u:
+                            continue
+                        seeds.append({"url": u, "title": u, "content": ""})
+                    raw_results["results"] = seeds
+                    logger.info(f"Seed URL mode: {len(seeds)} URLs provided")
+                except Exception as e:
+                    logger.warning(f"Failed to prepare seed URLs: {e}")
+
+            # If not focusing only on seeds, augment with search results
+            if (not focus_on_seed) or (not seed_urls):
+                try:
+                    if serpapi_api_key:
+                        extra = {"tbm": "nws"}
+                        if range_start and range_end:
+                            extra["tbs"] = f"cdr:1,cd_min:{range_start},cd_max:{range_end}"
+                        sr = await _search_serpapi(query, 100, "au", "en", extra)
+                        logger.info("Raw SERPAPI results retrieved")
+                        raw_results["results"].extend(sr.get("results", []))
                 except Exception as e:
-                    logger.error(f"Tavily fallback failed: {e}")
+                    logger.warning(f"SERPAPI search failed, will try Tavily fallback: {e}")
+                if tavily_api_key:
+                    try:
+                        tr = await _search_tavily(query, 50, include_domains)
+                        logger.info("Raw Tavily results retrieved (fallback)")
+                        raw_results["results"].extend(tr.get("results", []))
+                    except Exception as e:
+                        logger.error(f"Tavily fallback failed: {e}")
+            if health_task is not None:
+                await health_task
+        finally:
+            # A failed or cancelled search must not leave the probe running unobserved
+            _discard_task(health_task)
+        # Full payload dump is only worth serializing when DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw search results: %s", json.dumps(raw_results, default=str))
         
         # Filter results to ensure regional and incident relevance (looser criteria)
+        # Cheapest decisive check first: no incident signal rules a result out before any URL parsing
         def _is_candidate_result(item: dict) -> bool:
-            url = item.get("url", "") or ""
             content_lc = (item.get("content", "") or "").lower()
-            try:
-                netloc = urlparse(url).netloc.lower()
-            except Exception:
-                netloc = ""
-            domain_ok = any(d in url for d in include_domains) or netloc.endswith(".au")
-            region_ok = ("australia" in content_lc) or ("australian" in content_lc)
-            incident_ok = any(t in content_lc for t in [
-                "ransomware", "data breach", "breach", "cyberattack", "attack",
-                "leak", "exfiltration", "ddos", "exploit", "vulnerability", "malware"
-            ])
-            return (domain_ok or region_ok) and incident_ok
+            if not contains_any(content_lc, _CANDIDATE_INCIDENT_KW):
+                return False
+            if "australia" in content_lc:
+                return True
+            host = _canon_host(_result_canon(item))
+            return host.endswith(".au") or _is_included_host(host)
 
         raw_list = raw_results.get("results", [])
-        filtered_results = [r for r in raw_list if _is_candidate_result(r)]
-        logger.info(f"Filtered results count: {len(filtered_results)} (from {len(raw_list)})")
+        filtered_results = []
+        # Canonical URLs already kept; SERPAPI, Tavily and the second pass overlap heavily, and each
+        # duplicate that survives here costs a full page fetch and an extraction later
+        seen = set()
+        log_excluded = logger.isEnabledFor(logging.DEBUG)
+        for r in raw_list:
+            key = _result_canon(r)
+            if key in seen:
+                continue
+            if _is_candidate_result(r):
+                filtered_results.append(r)
+                seen.add(key)
+            elif log_excluded:
+                logger.debug("Excluded result: %s", r.get("url"))
+        logger.debug("Filtered results count: %d (from %d)", len(filtered_results), len(raw_list))
 
-        # If too few candidates, do a second pass (prefer Tavily unrestricted)
+        # If too few candidates, run the enrichment passes concurrently: Tavily unrestricted, SERPAPI
+        # news and the domain-focused SERPAPI pass are independent, so latency is the slowest one
         if len(filtered_results) < MIN_RESULTS_ENFORCED:
             range_clause = f" from {range_start} to {range_end}" if range_start and range_end else ""
             enriched_query = f"{query} (ransomware OR \"data breach\" OR cyberattack OR hack){range_clause}"
-            more_results = {"results": []}
+            extra = {"tbm": "nws"}
+            if range_start and range_end:
+                extra["tbs"] = f"cdr:1,cd_min:{range_start},cd_max:{range_end}"
+            passes = []
             if tavily_api_key:
-                try:
-                    tavily_tool_unrestricted = TavilySearch(
-                        max_results=50,
-                        topic="general",
-                        search_depth="advanced",
-                    )
-                    more_results = await asyncio.get_event_loop().run_in_executor(None, tavily_tool_unrestricted.invoke, enriched_query)
-                    logger.info("Second Tavily pass fetched")
-                except Exception as e:
-                    logger.warning(f"Second-pass Tavily failed: {e}")
-            if not more_results.get("results") and serpapi_api_key:
-                try:
-                    # Prefer Google News vertical with optional custom date range
-                    extra = {"tbm": "nws"}
-                    if range_start and range_end:
-                        extra["tbs"] = f"cdr:1,cd_min:{range_start},cd_max:{range_end}"
-                    more_results = await asyncio.get_event_loop().run_in_executor(None, _search_serpapi, enriched_query, 100, "au", "en", extra)
-                    logger.info("Second pass via SERPAPI fetched")
-                except Exception as e:
-                    logger.warning(f"Second-pass SERPAPI failed: {e}")
-            # Filter for relevance; allow .au or Australia mentions and cyber keywords
-            extra = []
-            for r in more_results.get("results", []):
-                url = r.get("url", "")
-                content_lc = (r.get("content", "") or "").lower()
-                try:
-                    netloc = urlparse(url).netloc.lower()
-                except Exception:
-                    netloc = ""
-                region_ok = netloc.endswith('.au') or ("australia" in content_lc) or ("australian" in content_lc)
-                incident_ok = any(t in content_lc for t in ["ransomware","phishing","ddos","exploit","vulnerability","data breach","cyberattack","breach","leak","malware"])
-                if region_ok and incident_ok:
-                    extra.append(r)
-            # Deduplicate by URL
-            seen = {r["url"] for r in filtered_results}
-            for r in extra:
-                if r.get("url") and r["url"] not in seen:
-                    filtered_results.append(r)
-                    seen.add(r["url"])
-            # If still low, try SERPAPI on top security news + AU news domains
-            if len(filtered_results) < MIN_RESULTS_ENFORCED and serpapi_api_key:
-                try:
-                    top_domains = [
-                        "thehackernews.com","securityweek.com","bleepingcomputer.com",
-                        "csoonline.com","theregister.com","zdnet.com","scmagazine.com",
-                        "databreaches.net","darkreading.com","cyberdaily.au",
-                        # AU outlets
-                        "abc.net.au","smh.com.au","afr.com","news.com.au","9news.com.au","7news.com.au","theage.com.au","itnews.com.au"
-                    ]
-                    domain_query = f"{query} (breach OR ransomware OR cyberattack) (" + " OR ".join([f'site:{d}' for d in top_domains]) + ")"
-                    extra = {"tbm": "nws"}
-                    if range_start and range_end:
-                        extra["tbs"] = f"cdr:1,cd_min:{range_start},cd_max:{range_end}"
-                    more2 = await asyncio.get_event_loop().run_in_executor(None, _search_serpapi, domain_query, 70, "au", "en", extra)
-                    extra_candidates = [
-                        r for r in more2.get("results", [])
-                        if any(term in (r.get("content", "").lower()) for term in [
-                            "australia","australian","ransomware","phishing","ddos","exploit","vulnerability","data breach","cyberattack","breach","leak"
-                        ])
-                    ]
-                    for r in extra_candidates:
-                        if r.get("url") and r["url"] not in seen:
-                            filtered_results.append(r)
-                            seen.add(r["url"])
-                    logger.info("Domain-focused SERPAPI pass fetched")
-                except Exception as e:
-                    logger.warning(f"Domain-focused SERPAPI pass failed: {e}")
-        
-        # Deduplicate by URL and title before formatting
-        def _dedupe_results(items: list[dict]) -> list[dict]:
-            seen = set()
-            out = []
-            for r in items:
-                url = (r.get("url") or "").strip().lower()
-                # Strip query/fragments
-                try:
-                    pu = urlparse(url)
-                    canon_url = f"{pu.scheme}://{pu.netloc}{pu.path}".rstrip("/")
-                except Exception:
-                    canon_url = url.rstrip("/")
-                title_key = re.sub(r"\W+", "", (r.get("title") or "").lower())[:80]
-                key = (canon_url, title_key)
-                if key in seen:
+                passes.append(("Second-pass Tavily", False, _search_tavily(enriched_query, 50)))
+            if serpapi_api_key:
+                passes.append(("Second-pass SERPAPI", False, _search_serpapi(enriched_query, 100, "au", "en", extra)))
+                top_domains = [
+                    "thehackernews.com","securityweek.com","bleepingcomputer.com",
+                    "csoonline.com","theregister.com","zdnet.com","scmagazine.com",
+                    "databreaches.net","darkreading.com","cyberdaily.au",
+                    # AU outlets
+                    "abc.net.au","smh.com.au","afr.com","news.com.au","9news.com.au","7news.com.au","theage.com.au","itnews.com.au"
+                ]
+                domain_query = f"{query} (breach OR ransomware OR cyberattack) (" + " OR ".join([f'site:{d}' for d in top_domains]) + ")"
+                passes.append(("Domain-focused SERPAPI pass", True, _search_serpapi(domain_query, 70, "au", "en", extra)))
+            pass_results = await asyncio.gather(*(coro for _, _, coro in passes), return_exceptions=True)
+            # Filter for relevance (.au or Australia mentions and cyber keywords) and dedupe by URL in one pass
+            for (label, domain_pass, _), more_results in zip(passes, pass_results):
+                if isinstance(more_results, Exception):
+                    logger.warning(f"{label} failed: {more_results}")
                     continue
-                seen.add(key)
-                out.append(r)
-            return out
-
-        filtered_results = _dedupe_results(filtered_results)
-
-        # Generate output from raw results and filter by date range, if provided
-        # Run the formatting in a thread pool to avoid blocking
+                logger.info("%s fetched", label)
+                for r in more_results.get("results", []):
+                    url = r.get("url", "")
+                    key = _result_canon(r)
+                    if not url or key in seen:
+                        continue
+                    content_lc = (r.get("content", "") or "").lower()
+                    if domain_pass:
+                        # Results are already restricted to known outlets; only the incident terms matter
+                        keep = contains_any(content_lc, _DOMAIN_PASS_KW)
+                    else:
+                        region_ok = _canon_host(key).endswith('.au') or ("australia" in content_lc)
+                        keep = region_ok and contains_any(content_lc, _SECOND_PASS_INCIDENT_KW)
+                    if keep:
+                        filtered_results.append(r)
+                        seen.add(key)
+
+        # Generate output from raw results and filter by date range, if provided.
         enforce_min = False if seed_urls else True
-        output = await asyncio.get_event_loop().run_in_executor(None, format_raw_results, filtered_results, 0, llm, range_start, range_end, enforce_min)
+        output = await format_raw_results(filtered_results, 0, llm, range_start, range_end, enforce_min)
         
         if not output.strip():
             logger.warning("No relevant results found")
@@ -374,7 +932,8 @@ async def perform_search(query, server_name: str = None, model_name: str = "gran
         overall_end_time = time.time()
         generation_time = overall_end_time - overall_start_time
 
-        await database.add_research(query, output, generation_time, selected_server['name'], model_name)
+        # Persist off the response path; the report is returned without waiting on SQLite
+        _spawn_background(database.add_research(query, output, generation_time, selected_server['name'], model_name, sources=filtered_results))
         return output, generation_time
     except Exception as e:
         logger.error(f"Error processing query: {str(e)}")
@@ -385,95 +944,350 @@ async def perform_search(query, server_name: str = None, model_name: str = "gran
         return f"Error processing query: {str(e)}", None
 
 # Function to format raw results
-def format_raw_results(results, start_count, llm, range_start=None, range_end=None, enforce_min: bool = True):
-    output = ""
-    included = 0
+# Patterns used by the format_raw_results helpers on every article, compiled once
+_ISO_DAY_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+_ISO_MONTH_RE = re.compile(r"(\d{4}-\d{2})")
+_ISO_YEAR_RE = re.compile(r"(\d{4})")
+# YYYY-MM with an optional -DD in one scan; group 2 is set only for a full date
+_ISO_MONTH_OR_DAY_WORD_RE = re.compile(r"\b(\d{4}-\d{2})(-\d{2})?\b")
+_YEAR_MONTH_PARTS_RE = re.compile(r"(\d{4})-(\d{2})")
+_QUARTER_RE = re.compile(r"Q([1-4])\s+(\d{4})", re.IGNORECASE)
+CVE_RE = re.compile(r"\bCVE-\d{4}-\d{4,7}\b", re.IGNORECASE)
+_URL_DATE_SLASH_RE = re.compile(r'/([0-9]{4})/([0-9]{2})/([0-9]{2})(?:/|$)')
+_URL_DATE_DASH_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+_URL_DATE_COMPACT_RE = re.compile(r'(?:[^0-9]|^)((20\d{2})(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01]))(?:[^0-9]|$)')
+_TITLE_TARGET_RE = re.compile(r"^([A-Z][A-Za-z0-9&\-\.]+(?:\s+[A-Z][A-Za-z0-9&\-\.]+){0,4})\s+(?:data breach|breach|ransomware|cyber ?attack|hack|incident)", re.IGNORECASE)
+_PROPER_NOUN_RE = re.compile(r"\b([A-Z][\w&\-\.]+(?:\s+[A-Z][\w&\-\.]+){0,3})\b")
+_COMPANY_SUFFIX_RE = re.compile(r"\b(Pty|Ltd|Limited|Corp|Corporation|Inc|LLC|PLC)\b", re.IGNORECASE)
+_JSONLD_SCRIPT_RE = re.compile(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.IGNORECASE | re.DOTALL)
+_JSONLD_DATE_RE = re.compile(r'"date(Published|Created|Modified)"\s*:\s*"([^"]+)"', re.IGNORECASE)
+_OG_PUBLISHED_RE = re.compile(r'<meta[^>]+property=["\']article:published_time["\'][^>]+content=["\']([^"\']+)["\']', re.IGNORECASE)
+# Every date form in article text, found in one scan: ISO "YYYY-MM-DD", "DD Month YYYY",
+# "DD Mon YYYY", and "Month DD, YYYY". The last is matched from its digit-led tail ("DD, YYYY")
+# and the few characters before it are checked for a month name (_MONTH_BEFORE_RE), so the scan
+# never tries a month-name branch at every position. The alternation sits in a lookahead, so no
+# match consumes text another form starts in; _first_text_date applies the priority between forms
+_TEXT_DATE_RE = re.compile(
+    r"\b(?=(?P<iso>\d{4}-\d{2}-\d{2})\b"
+    r"|(?P<day>\d{1,2})\s+(?:(?P<month>January|February|March|April|May|June|July|August|September|October|November|December)"
+    r"|(?P<mon>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec))\s+(?P<year>\d{4})\b"
+    r"|(?P<tail_day>\d{1,2}),\s*(?P<tail_year>\d{4})\b)",
+    re.IGNORECASE,
+)
+_MONTH_BEFORE_RE = re.compile(r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+$", re.IGNORECASE)
+# Field labels the LLM sometimes echoes into values: whole echoed lines are dropped from summaries,
+# a leading label is stripped from single fields
+_FIELD_LABELS = r"(?:Date of Incident|Targets|Method|Incident\?):"
+_ECHOED_FIELD_LINE_RE = re.compile(rf"(?mi)^{_FIELD_LABELS}.*$")
+_FIELD_LABEL_PREFIX_RE = re.compile(rf"(?mi)^{_FIELD_LABELS}\s*")
+
+def _first_text_date(text: str) -> str | None:
+    # YYYY-MM-DD of the first date in text, preferring (as separate searches used to) an ISO date,
+    # then "DD Month YYYY", then "Month DD, YYYY", then "DD Mon YYYY" anywhere in the text
+    best: dict[str, str] = {}
+    for m in _TEXT_DATE_RE.finditer(text or ""):
+        if m.group("iso"):
+            return m.group("iso")
+        if m.group("day"):
+            kind = "month" if m.group("month") else "mon"
+            if kind in best:
+                continue
+            day, year = int(m.group("day")), int(m.group("year"))
+            if kind == "month":
+                month = _MONTH_NUMBERS[m.group("month").capitalize()]
+            else:
+                month = _MONTH_ABBR_NUMBERS[m.group("mon").capitalize()]
+        else:
+            if "tail" in best:
+                continue
+            pm = _MONTH_BEFORE_RE.search(text, max(0, m.start() - 24), m.start())
+            if not pm:
+                continue
+            kind = "tail"
+            day, year = int(m.group("tail_day")), int(m.group("tail_year"))
+            month = _MONTH_NUMBERS[pm.group(1).capitalize()]
+        best[kind] = f"{year:04d}-{month:02d}-{day:02d}"
+    for kind in ("month", "tail", "mon"):
+        if kind in best:
+            return best[kind]
+    return None
+
+_JSONLD_DATE_KEYS = ("datePublished", "dateCreated", "dateModified")
+
+def _jsonld_date(data) -> str | None:
+    # Walk the parsed JSON-LD (top-level lists, @graph arrays, nested Article objects) and prefer
+    # datePublished, then dateCreated, then dateModified, wherever they sit
+    found: dict[str, str] = {}
+    stack = [data]
+    while stack and "datePublished" not in found:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key in _JSONLD_DATE_KEYS:
+                value = node.get(key)
+                if key not in found and isinstance(value, str) and value:
+                    found[key] = value
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    for key in _JSONLD_DATE_KEYS:
+        if key in found:
+            return found[key]
+    return None
+
+def _date_from_iso(iso: str) -> str | None:
+    # Most specific leading date in a timestamp: YYYY-MM-DD, else YYYY-MM, else YYYY
+    for rx in (_ISO_DAY_RE, _ISO_MONTH_RE, _ISO_YEAR_RE):
+        m = rx.search(iso)
+        if m:
+            return m.group(1)
+    return None
 
-    incident_keywords = (
-        "breach", "attack", "ransomware", "extortion", "data leak", "leaked",
-        "hacked", "cyberattack", "intrusion", "compromise", "outage"
-    )
-    non_incident_keywords = (
-        "op-ed", "op ed", "opinion", "analysis", "predictions", "awareness month",
-        "legislation", "act passed", "bill", "law", "aggregator", "roundup", "round-up",
-        "rules", "policy", "regulation", "regulatory", "report", "trends", "trend report",
-        "awareness", "election", "strategy", "framework", "act", "legislation",
-        "list of", "complete list", "notifications", "notification", "digest", "weekly",
-        "monthly", "annual", "what we know", "explainer", "guide", "webinar", "register",
-        "sign up", "panel", "roundtable", "fireside", "forecast", "landscape", "overview",
-        "top ransomware groups", "battle", "what to expect"
-    )
+# A search snippet this long that already names a CVE, or a date plus an incident term, gives the
+# extraction everything the full page would; fetching it only costs a round trip and a parse
+RICH_SNIPPET_MIN_CHARS = 800
 
-    def _normalize_method(m: str) -> str:
-        if not m:
-            return "Not specified"
-        t = m.strip().lower()
-        if t in {"not specified","n/a","na","none","unknown","-","no"}:
-            return "Not specified"
-        mapping = {
-            "ransom": "Ransomware",
-            "lockbit": "Ransomware",
-            "blackcat": "Ransomware",
-            "double extortion": "Ransomware",
-            "extortion": "Ransomware",
-            "data breach": "Data breach",
-            "breach": "Data breach",
-            "leak": "Data breach",
-            "exfiltration": "Data breach",
-            "phishing": "Phishing",
-            "credential": "Credential stuffing",
-            "ddos": "DDoS",
-            "denial of service": "DDoS",
-            "vulnerability": "Vulnerability exploitation",
-            "exploit": "Vulnerability exploitation",
-            "sql injection": "Vulnerability exploitation",
-            "supply chain": "Supply chain compromise",
-            "third-party": "Supply chain compromise",
-            "bec": "Business email compromise",
-            "business email": "Business email compromise",
-            "vishing": "Vishing",
-            "voice phishing": "Vishing",
-            "backdoor": "Malware/Backdoor",
-            "malware": "Malware/Backdoor",
-            "espionage": "Espionage",
-        }
-        for k, v in mapping.items():
-            if k in t:
-                return v
-        # If the method doesn't map to a known class, treat as unknown
+def _is_rich_snippet(snippet: str) -> bool:
+    if not snippet or len(snippet) < RICH_SNIPPET_MIN_CHARS:
+        return False
+    if CVE_RE.search(snippet):
+        return True
+    return _first_text_date(snippet) is not None and contains_any(snippet.lower(), _INCIDENT_KW)
+
+# Attack-method keywords in priority order; the first one present in the lowercased text decides
+_METHOD_KEYWORDS = (
+    ("double extortion", "Ransomware"),
+    ("ransomware", "Ransomware"),
+    ("data breach", "Data breach"),
+    ("exfiltration", "Data breach"),
+    ("leak", "Data breach"),
+    ("phishing", "Phishing"),
+    ("business email", "Business email compromise"),
+    ("bec", "Business email compromise"),
+    ("credential", "Credential stuffing"),
+    ("ddos", "DDoS"),
+    ("denial of service", "DDoS"),
+    ("sql injection", "Vulnerability exploitation"),
+    ("vulnerability", "Vulnerability exploitation"),
+    ("exploit", "Vulnerability exploitation"),
+    ("supply chain", "Supply chain compromise"),
+    ("third-party", "Supply chain compromise"),
+    ("backdoor", "Malware/Backdoor"),
+    ("malware", "Malware/Backdoor"),
+    ("espionage", "Espionage"),
+)
+
+def _infer_method_from_text(text_lc: str) -> str:
+    # Expects lowercased text; callers already hold a lowercased copy of the article
+    for k, v in _METHOD_KEYWORDS:
+        if k in text_lc:
+            return v
+    return "Not specified"
+
+# Values the LLM uses for "unknown"; one definition for the method and generic field sanitizers
+_NEG_FIELD_VALUES = frozenset({"not specified", "n/a", "na", "none", "unknown", "-", "no"})
+# Labels whose presence in a date value means another field bled into it
+_DATE_FIELD_LABEL_TAINTS = ("Targets:", "Method:", "Incident")
+
+# LLM method labels mapped onto the canonical classes, first matching substring wins
+_METHOD_ALIASES = (
+    ("ransom", "Ransomware"),
+    ("lockbit", "Ransomware"),
+    ("blackcat", "Ransomware"),
+    ("double extortion", "Ransomware"),
+    ("extortion", "Ransomware"),
+    ("data breach", "Data breach"),
+    ("breach", "Data breach"),
+    ("leak", "Data breach"),
+    ("exfiltration", "Data breach"),
+    ("phishing", "Phishing"),
+    ("credential", "Credential stuffing"),
+    ("ddos", "DDoS"),
+    ("denial of service", "DDoS"),
+    ("vulnerability", "Vulnerability exploitation"),
+    ("exploit", "Vulnerability exploitation"),
+    ("sql injection", "Vulnerability exploitation"),
+    ("supply chain", "Supply chain compromise"),
+    ("third-party", "Supply chain compromise"),
+    ("bec", "Business email compromise"),
+    ("business email", "Business email compromise"),
+    ("vishing", "Vishing"),
+    ("voice phishing", "Vishing"),
+    ("backdoor", "Malware/Backdoor"),
+    ("malware", "Malware/Backdoor"),
+    ("espionage", "Espionage"),
+)
+
+def _normalize_method(m: str) -> str:
+    if not m:
         return "Not specified"
+    t = m.strip().lower()
+    if t in _NEG_FIELD_VALUES:
+        return "Not specified"
+    for k, v in _METHOD_ALIASES:
+        if k in t:
+            return v
+    # If the method doesn't map to a known class, treat as unknown
+    return "Not specified"
+
+# Every echoed label ends in ":", so values without one skip the label regex entirely
+def _sanitize_summary(s: str) -> str:
+    if not s:
+        return s
+    # Remove any stray field lines the LLM might have echoed
+    if ":" in s:
+        s = _ECHOED_FIELD_LINE_RE.sub("", s)
+    # Collapse whitespace and keep a single clean paragraph
+    return _WS_RE.sub(" ", s).strip()
+
+def _sanitize_field(val: str) -> str:
+    if not val:
+        return "Not specified"
+    v = str(val).strip()
+    if not v:
+        return "Not specified"
+    if ":" in v:
+        v = _FIELD_LABEL_PREFIX_RE.sub("", v).strip()
+    if v.lower() in _NEG_FIELD_VALUES:
+        return "Not specified"
+    return v
+
+# Friendly labels appended to well-known CVEs in the Exploit Used line
+_CVE_LABELS = {
+    "CVE-2025-29824": "(now-patched Windows 0-day)",
+}
+
+def _format_cves(cves: list[str], cited: str = "") -> str:
+    # Exact-ID set lookup, so CVE-2024-1234 no longer hides behind an already-cited CVE-2024-12345
+    known = {c.upper() for c in CVE_RE.findall(cited)} if cited else ()
+    return ", ".join(f"{c} {_CVE_LABELS.get(c, '')}".strip() for c in cves if c not in known)
+
+def _prefilter_report_results(results: list[dict]) -> list[dict]:
+    # Report candidates in order, judged on title + snippet before any fetch or LLM call
+    candidates = []
+    # Syndicated copies of one story arrive under different canonical URLs with the same title and
+    # snippet; keep the first so the rest cost neither a page fetch nor a report entry. The title is
+    # part of the key because a publisher's boilerplate snippet (paywall or cookie text) repeats
+    # across unrelated articles
+    seen_snippets = set()
+    for result in results:
+        title = result.get("title", "Untitled Incident")
+        snippet = result.get("content", "No description available")
+        url = result.get("url", "Not specified")
 
-    def _fetch_page_content(page_url: str, fallback: str):
-        try:
-            parsed = urlparse(page_url)
-            domain = parsed.netloc.lower()
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-            }
-            resp = httpx.get(page_url, headers=headers, timeout=10.0, follow_redirects=True)
-            if resp.status_code != 200:
-                return fallback, None
-            html = resp.text
-            # Strip scripts/styles and common boilerplate tags
-            html = re.sub(r"(?is)<script[^>]*>.*?</script>", " ", html)
-            html = re.sub(r"(?is)<style[^>]*>.*?</style>", " ", html)
-            html = re.sub(r"(?is)<nav[^>]*>.*?</nav>", " ", html)
-            html = re.sub(r"(?is)<header[^>]*>.*?</header>", " ", html)
-            html = re.sub(r"(?is)<footer[^>]*>.*?</footer>", " ", html)
-            # Remove all tags
-            text = re.sub(r"(?is)<[^>]+>", " ", html)
-            text = unescape(text)
-            text = re.sub(r"\s+", " ", text).strip()
-            # Limit length to avoid overloading prompt
-            if len(text) > MAX_ARTICLE_CHARS:
-                text = text[:MAX_ARTICLE_CHARS]
-            # Prefer fetched content if it seems longer than the snippet
-            if len(text) > max(len(fallback), 1000):
-                return text, resp.text
-            return fallback, resp.text
-        except Exception as e:
-            logger.info(f"Full page fetch failed for {page_url}: {e}")
+        # Skip obvious non-article homepages (canonical form is a bare host)
+        canon = _result_canon(result)
+        if canon and "/" not in canon:
+            continue
+
+        # Quick prefilter using title + snippet to avoid unnecessary fetch/LLM
+        pre_lc = f"{title} {snippet}".lower()
+        if contains_any(pre_lc, _HARD_EXCLUDE_KW):
+            continue
+        if contains_any(pre_lc, _NON_INCIDENT_KW) and not contains_any(pre_lc, _INCIDENT_KW):
+            continue
+        # Short or missing snippets ("No description available") say nothing about the article
+        if snippet and len(snippet) >= MIN_EXTRACTION_CHARS:
+            snippet_key = (
+                _WS_RE.sub(" ", (title or "").lower()).strip(),
+                _WS_RE.sub(" ", snippet[:1024].lower()).strip(),
+            )
+            if snippet_key in seen_snippets:
+                logger.debug("Skipping %s: same title and snippet as an earlier result", url)
+                continue
+            seen_snippets.add(snippet_key)
+        candidates.append(result)
+    return candidates
+
+async def format_raw_results(results, start_count, llm, range_start=None, range_end=None, enforce_min: bool = True):
+    # Report sections are collected and joined once at the end
+    parts: list[str] = []
+    included = 0
+    model_name = getattr(llm, "model", "") or ""
+    # Ollama decodes under a JSON grammar when asked; other providers follow the prompt alone
+    extract_llm = llm.bind(format="json") if isinstance(llm, ChatOllama) else llm
+
+    fetch_semaphore = asyncio.Semaphore(PAGE_FETCH_CONCURRENCY)
+
+    # One load per page URL per report: the relaxed backfill reuses pages the primary pass
+    # already pulled, including ones it went on to reject, instead of fetching them again
+    page_loads: dict[str, asyncio.Task] = {}
+
+    async def _fetch_page_content(page_url: str, fallback: str):
+        cache_key = _page_cache_key(page_url)
+        if cache_key:
+            task = page_loads.get(cache_key)
+            if task is None:
+                task = page_loads[cache_key] = asyncio.ensure_future(_load_page(page_url, cache_key))
+            page = await task
+        else:
+            page = await _load_page(page_url, cache_key)
+        if page is None:
             return fallback, None
+        text, raw_html = page
+        # Prefer fetched content if it seems longer than the snippet
+        if len(text) > max(len(fallback), 1000):
+            return text, raw_html
+        return fallback, raw_html
+
+    async def _load_page(page_url: str, cache_key: str):
+        # (text, raw HTML) for a page, or None when it can't be fetched. Pages survive across
+        # reports in page_cache for PAGE_CACHE_TTL_HOURS, so overlapping queries and seed reruns
+        # skip the HTTP round trip and the HTML parse; after that, pages with an ETag or
+        # Last-Modified are revalidated with a conditional GET.
+        page = None
+        stale = None
+        if cache_key:
+            try:
+                cached = await database.get_cached_article(cache_key, PAGE_CACHE_TTL_HOURS)
+            except Exception as e:
+                logger.info("Page cache unavailable: %s", e)
+                cached = None
+            if cached is not None:
+                if cached[4]:
+                    page = (cached[0], cached[1])
+                elif cached[2] or cached[3]:
+                    # Expired, but the origin gave validators: a 304 reuses the stored page
+                    stale = cached
+        if page is None:
+            headers = _FETCH_HEADERS
+            if stale is not None:
+                headers = dict(_FETCH_HEADERS)
+                if stale[2]:
+                    headers["If-None-Match"] = stale[2]
+                if stale[3]:
+                    headers["If-Modified-Since"] = stale[3]
+            try:
+                # httpx timeouts are per read, so a slow-dripping host could hold a slot far longer;
+                # the deadline caps the whole fetch and the article falls back to its snippet
+                async with fetch_semaphore, asyncio.timeout(PAGE_FETCH_DEADLINE_S):
+                    async with get_http_client().stream("GET", page_url, headers=headers, timeout=10.0, follow_redirects=True) as resp:
+                        if resp.status_code == 304 and stale is not None:
+                            html = None
+                        elif resp.status_code != 200:
+                            return None
+                        else:
+                            html = await read_page_capped(resp)
+                        resp_headers = resp.headers
+                if html is None:
+                    page = (stale[0], stale[1])
+                else:
+                    # Parsing a large page holds the CPU for tens of milliseconds; on a worker thread
+                    # (lxml releases the GIL while parsing) the other fetches and LLM calls keep moving.
+                    # Limit length to avoid overloading prompt
+                    page = ((await asyncio.to_thread(html_to_text, html))[:MAX_ARTICLE_CHARS], html)
+            except Exception as e:
+                logger.info("Full page fetch failed for %s: %r", page_url, e)
+                return None
+            # Pages the origin marks no-store are used for this report only
+            if cache_key and "no-store" not in resp_headers.get("Cache-Control", "").lower():
+                if html is None:
+                    _spawn_background(database.touch_cached_article(cache_key))
+                else:
+                    _spawn_background(database.upsert_cached_article(
+                        cache_key, page_url, page[0], page[1],
+                        resp_headers.get("ETag"), resp_headers.get("Last-Modified"),
+                    ))
+        return page
 
     def _format_header_date_range(rs: str | None, re_: str | None) -> str | None:
         try:
@@ -483,14 +1297,13 @@ def format_raw_results(results, start_count, llm, range_start=None, range_end=No
             sdt = _dt.strptime(rs, "%Y-%m-%d")
             edt = _dt.strptime(re_, "%Y-%m-%d")
             same_year = sdt.year == edt.year
-            month_map = ["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]
             if same_year:
                 if sdt.month == edt.month:
-                    return f"{month_map[sdt.month-1]} {sdt.day} - {month_map[edt.month-1]} {edt.day}, {edt.year}"
+                    return f"{_MONTH_ABBRS[sdt.month-1]} {sdt.day} - {_MONTH_ABBRS[edt.month-1]} {edt.day}, {edt.year}"
                 else:
-                    return f"{month_map[sdt.month-1]} {sdt.day} - {month_map[edt.month-1]} {edt.day}, {edt.year}"
+                    return f"{_MONTH_ABBRS[sdt.month-1]} {sdt.day} - {_MONTH_ABBRS[edt.month-1]} {edt.day}, {edt.year}"
             else:
-                return f"{month_map[sdt.month-1]} {sdt.day}, {sdt.year} - {month_map[edt.month-1]} {edt.day}, {edt.year}"
+                return f"{_MONTH_ABBRS[sdt.month-1]} {sdt.day}, {sdt.year} - {_MONTH_ABBRS[edt.month-1]} {edt.day}, {edt.year}"
         except Exception:
             return None
 
@@ -500,17 +1313,15 @@ def format_raw_results(results, start_count, llm, range_start=None, range_end=No
         s = date_str.strip()
         try:
             # YYYY-MM-DD
-            if re.fullmatch(r"\d{4}-\d{2}-\d{2}", s):
+            if _ISO_DAY_RE.fullmatch(s):
                 y, m, d = s.split("-")
-                month_names = ["January","February","March","April","May","June","July","August","September","October","November","December"]
-                return f"{month_names[int(m)-1]} {int(d)}, {y}"
+                return f"{MONTH_NAMES[int(m)-1]} {int(d)}, {y}"
             # YYYY-MM
-            if re.fullmatch(r"\d{4}-\d{2}", s):
+            if _ISO_MONTH_RE.fullmatch(s):
                 y, m = s.split("-")
-                month_names = ["January","February","March","April","May","June","July","August","September","October","November","December"]
-                return f"{month_names[int(m)-1]} {y}"
+                return f"{MONTH_NAMES[int(m)-1]} {y}"
             # YYYY
-            if re.fullmatch(r"\d{4}", s):
+            if _ISO_YEAR_RE.fullmatch(s):
                 return s
         except Exception:
             pass
@@ -520,7 +1331,7 @@ def format_raw_results(results, start_count, llm, range_start=None, range_end=No
         if not text:
             return []
         try:
-            matches = re.findall(r"\bCVE-\d{4}-\d{4,7}\b", text, flags=re.IGNORECASE)
+            matches = CVE_RE.findall(text)
             # Normalize to upper and dedupe while preserving order
             seen = set()
             cves = []
@@ -535,18 +1346,18 @@ def format_raw_results(results, start_count, llm, range_start=None, range_end=No
 
     def _extract_date_from_url(u: str) -> str:
         try:
-            m = re.search(r'/([0-9]{4})/([0-9]{2})/([0-9]{2})(?:/|$)', u)
+            m = _URL_DATE_SLASH_RE.search(u)
             if m:
                 y, mo, d = int(m.group(1)), int(m.group(2)), int(m.group(3))
                 if 1 <= mo <= 12 and 1 <= d <= 31:
                     return f"{y:04d}-{mo:02d}-{d:02d}"
-            m = re.search(r'([0-9]{4})-([0-9]{2})-([0-9]{2})', u)
+            m = _URL_DATE_DASH_RE.search(u)
             if m:
                 y, mo, d = int(m.group(1)), int(m.group(2)), int(m.group(3))
                 if 1 <= mo <= 12 and 1 <= d <= 31:
                     return f"{y:04d}-{mo:02d}-{d:02d}"
             # Also detect compact YYYYMMDD anywhere in the URL (e.g., -20250915-)
-            m = re.search(r'(?:[^0-9]|^)((20\d{2})(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01]))(?:[^0-9]|$)', u)
+            m = _URL_DATE_COMPACT_RE.search(u)
             if m:
                 y = int(m.group(2)); mo = int(m.group(3)); d = int(m.group(4))
                 if 1 <= mo <= 12 and 1 <= d <= 31:
@@ -559,7 +1370,7 @@ def format_raw_results(results, start_count, llm, range_start=None, range_end=No
         try:
             t = title.strip()
             # Patterns like "Acme Corp data breach", "XYZ hit by ransomware"
-            m = re.search(r"^([A-Z][A-Za-z0-9&\-\.]+(?:\s+[A-Z][A-Za-z0-9&\-\.]+){0,4})\s+(?:data breach|breach|ransomware|cyber ?attack|hack|incident)", t, re.IGNORECASE)
+            m = _TITLE_TARGET_RE.search(t)
             if m:
                 candidate = m.group(1).strip()
                 # Avoid generic words
@@ -583,10 +1394,10 @@ def format_raw_results(results, start_count, llm, range_start=None, range_end=No
         if t.lower() in generic:
             return False
         # Look for proper nouns/entities
-        if re.search(r"\b([A-Z][\w&\-\.]+(?:\s+[A-Z][\w&\-\.]+){0,3})\b", t):
+        if _PROPER_NOUN_RE.search(t):
             return True
         # Company suffixes
-        if re.search(r"\b(Pty|Ltd|Limited|Corp|Corporation|Inc|LLC|PLC)\b", t, re.IGNORECASE):
+        if _COMPANY_SUFFIX_RE.search(t):
             return True
         return False
 
@@ -595,40 +1406,24 @@ def format_raw_results(results, start_count, llm, range_start=None, range_end=No
             return None
         try:
             # Look for JSON-LD datePublished/dateCreated/dateModified
-            for m in re.finditer(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', raw_html, re.IGNORECASE | re.DOTALL):
+            for m in _JSONLD_SCRIPT_RE.finditer(raw_html):
                 json_text = m.group(1)
-                # Find ISO-like timestamps
-                d = re.search(r'"date(Published|Created|Modified)"\s*:\s*"([^"]+)"', json_text, re.IGNORECASE)
-                if d:
-                    iso = d.group(2)
-                    # Extract YYYY-MM-DD if present
-                    mdate = re.search(r'(\d{4}-\d{2}-\d{2})', iso)
-                    if mdate:
-                        return mdate.group(1)
-                    # Fallback to YYYY-MM
-                    mdate = re.search(r'(\d{4}-\d{2})', iso)
-                    if mdate:
-                        return mdate.group(1)
-                    # Fallback to YYYY
-                    mdate = re.search(r'(\d{4})', iso)
-                    if mdate:
-                        return mdate.group(1)
+                try:
+                    iso = _jsonld_date(json_loads(json_text))
+                except ValueError:
+                    # Hand-written JSON-LD is often invalid (trailing commas, raw newlines); scan it instead
+                    d = _JSONLD_DATE_RE.search(json_text)
+                    iso = d.group(2) if d else None
+                if iso:
+                    date = _date_from_iso(iso)
+                    if date:
+                        return date
             # OpenGraph/Meta tag
-            m = re.search(r'<meta[^>]+property=["\']article:published_time["\'][^>]+content=["\']([^"\']+)["\']', raw_html, re.IGNORECASE)
+            m = _OG_PUBLISHED_RE.search(raw_html)
             if m:
-                iso = m.group(1)
-                mdate = re.search(r'(\d{4}-\d{2}-\d{2})', iso)
-                if mdate:
-                    return mdate.group(1)
-                mdate = re.search(r'(\d{4}-\d{2})', iso)
-                if mdate:
-                    return mdate.group(1)
-                mdate = re.search(r'(\d{4})', iso)
-                    
-                if mdate:
-                    return mdate.group(1)
+                return _date_from_iso(m.group(1))
         except Exception as e:
-            logger.info(f"Metadata date extraction failed: {e}")
+            logger.info("Metadata date extraction failed: %s", e)
         return None
 
     def _normalize_date_for_filter(date_str: str):
@@ -637,17 +1432,17 @@ def format_raw_results(results, start_count, llm, range_start=None, range_end=No
             return None, None
         ds = date_str.strip()
         # Exact date
-        m = re.fullmatch(r"(\d{4}-\d{2}-\d{2})", ds)
+        m = _ISO_DAY_RE.fullmatch(ds)
         if m:
             return m.group(1), m.group(1)
         # Year-month
-        m = re.fullmatch(r"(\d{4})-(\d{2})", ds)
+        m = _YEAR_MONTH_PARTS_RE.fullmatch(ds)
         if m:
             y = int(m.group(1)); mo = int(m.group(2))
             last = calendar.monthrange(y, mo)[1]
             return f"{y:04d}-{mo:02d}-01", f"{y:04d}-{mo:02d}-{last:02d}"
         # Quarter (Q1 2025)
-        m = re.fullmatch(r"Q([1-4])\s+(\d{4})", ds, re.IGNORECASE)
+        m = _QUARTER_RE.fullmatch(ds)
         if m:
             q = int(m.group(1)); y = int(m.group(2))
             start_mo = (q - 1) * 3 + 1
@@ -657,53 +1452,19 @@ def format_raw_results(results, start_count, llm, range_start=None, range_end=No
         return None, None
 
     def _within_range(incident_start: str, incident_end: str, rs: str, re_: str) -> bool:
-        try:
-            if not rs or not re_:
-                return True
-            if not incident_start and not incident_end:
-                return False
-            # If only one bound, use it for both
-            s = incident_start or incident_end
-            e = incident_end or incident_start
-            sdt = datetime.strptime(s, "%Y-%m-%d")
-            edt = datetime.strptime(e, "%Y-%m-%d")
-            rsdt = datetime.strptime(rs, "%Y-%m-%d"); redt = datetime.strptime(re_, "%Y-%m-%d")
-            # Overlap check (incident window intersects [rs,re])
-            return not (edt < rsdt or sdt > redt)
-        except Exception:
+        if not rs or not re_:
             return True
-
-    def _extract_date_from_text(text: str) -> str:
-        try:
-            # Common patterns: 2025-10-11, 11 October 2025, October 11, 2025, 11 Oct 2025
-            m = re.search(r"\b(\d{4}-\d{2}-\d{2})\b", text)
-            if m:
-                return m.group(1)
-            m = re.search(r"\b(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})\b", text, re.IGNORECASE)
-            if m:
-                # Normalize to YYYY-MM-DD with day padded
-                month_map = {m: i for i, m in enumerate(["January","February","March","April","May","June","July","August","September","October","November","December"], start=1)}
-                day = int(m.group(1))
-                month = month_map[m.group(2).capitalize()]
-                year = int(m.group(3))
-                return f"{year:04d}-{month:02d}-{day:02d}"
-            m = re.search(r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),\s*(\d{4})\b", text, re.IGNORECASE)
-            if m:
-                month_map = {m: i for i, m in enumerate(["January","February","March","April","May","June","July","August","September","October","November","December"], start=1)}
-                month = month_map[m.group(1).capitalize()]
-                day = int(m.group(2))
-                year = int(m.group(3))
-                return f"{year:04d}-{month:02d}-{day:02d}"
-            m = re.search(r"\b(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\s+(\d{4})\b", text, re.IGNORECASE)
-            if m:
-                month_map = {"Jan":1,"Feb":2,"Mar":3,"Apr":4,"May":5,"Jun":6,"Jul":7,"Aug":8,"Sep":9,"Sept":9,"Oct":10,"Nov":11,"Dec":12}
-                day = int(m.group(1))
-                month = month_map[m.group(2).capitalize()]
-                year = int(m.group(3))
-                return f"{year:04d}-{month:02d}-{day:02d}"
-        except Exception:
-            pass
-        return None
+        if not incident_start and not incident_end:
+            return False
+        # If only one bound, use it for both
+        s = incident_start or incident_end
+        e = incident_end or incident_start
+        # Zero-padded YYYY-MM-DD strings order chronologically, so no parsing is needed;
+        # anything else is treated as unknown and kept, as before
+        if not all(_ISO_DAY_RE.fullmatch(d) for d in (s, e, rs, re_)):
+            return True
+        # Overlap check (incident window intersects [rs,re])
+        return not (e < rs or s > re_)
 
     def _sanitize_date_field(date_str: str) -> str:
         if not date_str:
@@ -712,158 +1473,218 @@ def format_raw_results(results, start_count, llm, range_start=None, range_end=No
         if not s or s.lower() == "not specified":
             return "Not specified"
         # Discard obvious mis-parses where another field label bled into the value
-        if any(lbl in s for lbl in ("Targets:", "Method:", "Incident")):
+        if any(lbl in s for lbl in _DATE_FIELD_LABEL_TAINTS):
             return "Not specified"
-        # Prefer strict YYYY-MM-DD if present
-        m = re.search(r"\b(\d{4}-\d{2}-\d{2})\b", s)
-        if m:
-            return m.group(1)
-        # Accept YYYY-MM
-        m = re.search(r"\b(\d{4}-\d{2})\b", s)
-        if m:
-            return m.group(1)
+        # Prefer strict YYYY-MM-DD anywhere in the value, else the first YYYY-MM
+        year_month = None
+        for m in _ISO_MONTH_OR_DAY_WORD_RE.finditer(s):
+            if m.group(2):
+                return m.group(0)
+            if year_month is None:
+                year_month = m.group(1)
+        if year_month:
+            return year_month
         # Try to parse natural language date within the string
-        nat = _extract_date_from_text(s)
+        nat = _first_text_date(s)
         if nat:
             return nat
         return "Not specified"
 
-    def _infer_method_from_text(text: str) -> str:
-        t = text.lower()
-        checks = [
-            ("double extortion", "Ransomware"),
-            ("ransomware", "Ransomware"),
-            ("data breach", "Data breach"),
-            ("exfiltration", "Data breach"),
-            ("leak", "Data breach"),
-            ("phishing", "Phishing"),
-            ("business email", "Business email compromise"),
-            ("bec", "Business email compromise"),
-            ("credential", "Credential stuffing"),
-            ("ddos", "DDoS"),
-            ("denial of service", "DDoS"),
-            ("sql injection", "Vulnerability exploitation"),
-            ("vulnerability", "Vulnerability exploitation"),
-            ("exploit", "Vulnerability exploitation"),
-            ("supply chain", "Supply chain compromise"),
-            ("third-party", "Supply chain compromise"),
-            ("backdoor", "Malware/Backdoor"),
-            ("malware", "Malware/Backdoor"),
-            ("espionage", "Espionage"),
-        ]
-        for k, v in checks:
-            if k in t:
-                return v
-        return "Not specified"
-
-    def _sanitize_summary(s: str) -> str:
-        if not s:
-            return s
-        # Remove any stray field lines the LLM might have echoed
-        s = re.sub(r"(?mi)^(?:Date of Incident|Targets|Method|Incident\?):.*$", "", s)
-        # Collapse whitespace and keep a single clean paragraph
-        s = re.sub(r"\s+", " ", s).strip()
-        return s
-
-    def _sanitize_field(val: str) -> str:
-        if not val:
-            return "Not specified"
-        v = str(val).strip()
-        if not v:
-            return "Not specified"
-        v = re.sub(r"(?mi)^(?:Date of Incident|Targets|Method|Incident\?):\s*", "", v).strip()
-        if v.lower() in {"not specified","n/a","na","none","unknown","-","no"}:
-            return "Not specified"
-        return v
-
-    def _is_hard_exclude(title_text: str, content_text: str) -> bool:
-        tl = (title_text or "").lower()
-        cl = (content_text or "").lower()
-        terms = [
-            "annual cyber threat report",
-            "annual report",
-            "quarterly report",
-            "notifiable data breaches",
-            "data breach notifications",
-            "list of data breaches",
-            "complete list",
-            "roundup",
-            "round-up",
-            "digest",
-            "newsletter",
-        ]
-        return any(t in tl or t in cl for t in terms)
-
     # Header with date range if available
     header_range = _format_header_date_range(range_start, range_end)
     used_urls = set()
 
     if header_range:
-        output += f"# Cyber Threats and Risks ({header_range})\n\n<br><br>\n\n"
+        parts.append(f"# Cyber Threats and Risks ({header_range})\n\n<br><br>\n\n")
     else:
-        output += f"# Cyber Threats and Risks\n\n"
+        parts.append(f"# Cyber Threats and Risks\n\n")
 
-    for _idx, result in enumerate(results[:MAX_RESULTS_TO_ANALYZE], start_count + 1):
-        title = result.get("title", "Untitled Incident")
-        snippet = result.get("content", "No description available")
-        url = result.get("url", "Not specified")
-        
-        # Skip obvious non-article homepages
+    # Prefilter in order, then fetch pages and run LLM extractions concurrently. Classification
+    # and rendering below stay sequential, so numbering and ordering are unchanged.
+    candidates = _prefilter_report_results(results[:MAX_RESULTS_TO_ANALYZE])
+
+    async def _extract_single(content: str) -> str:
+        # Use LLM to extract structured data and summarize the article.
+        extraction_prompt = f'''{_EXTRACTION_PREAMBLE}
+Return the single JSON object for this article.
+
+Article: {truncate_for_prompt(content, MAX_PROMPT_CHARS)}
+'''
+        # LLM_SEMAPHORE caps in-flight requests at concurrency.llm_max_inflight (match OLLAMA_NUM_PARALLEL)
+        async with utils.LLM_SEMAPHORE:
+            return (await extract_llm.ainvoke(extraction_prompt)).content
+
+    async def _extract_batch(batch: list[tuple[str, str, asyncio.Future]]):
         try:
-            parsed_for_skip = urlparse(url)
-            if parsed_for_skip.path in ("", "/"):
-                continue
-        except Exception:
-            pass
+            if len(batch) == 1:
+                extracted_all = [await _extract_single(batch[0][0])]
+            else:
+                articles = "\n\n".join(
+                    f"Article {i}: {truncate_for_prompt(content, MAX_PROMPT_CHARS)}"
+                    for i, (content, _, _) in enumerate(batch, start=1)
+                )
+                batch_prompt = f'''{_EXTRACTION_PREAMBLE}
+Return a single JSON object {{"articles": [...]}} whose array holds exactly {len(batch)} objects, one per article below and in the same order, each with an added "article" key (the article number).
 
-        # Quick prefilter using title + snippet to avoid unnecessary fetch/LLM
-        pre_lc = f"{title} {snippet}".lower()
-        if _is_hard_exclude(title, snippet):
-            continue
-        if any(nk in pre_lc for nk in non_incident_keywords) and not any(kw in pre_lc for kw in incident_keywords):
-            continue
+{articles}
+'''
+                async with utils.LLM_SEMAPHORE:
+                    batch_text = (await extract_llm.ainvoke(batch_prompt)).content
+                extracted_all = _split_batch_extraction(batch_text, len(batch))
+                # Articles the batch reply dropped or garbled are re-asked alone, concurrently
+                misses = [i for i, extracted in enumerate(extracted_all) if extracted is None]
+                if misses:
+                    logger.debug("Batched extraction missed %d of %d articles; extracting them alone", len(misses), len(batch))
+                    retried = await asyncio.gather(*(_extract_single(batch[i][0]) for i in misses), return_exceptions=True)
+                    for i, extracted in zip(misses, retried):
+                        extracted_all[i] = extracted
+            for (content, cache_key, fut), extracted in zip(batch, extracted_all):
+                if isinstance(extracted, BaseException):
+                    if not fut.done():
+                        fut.set_exception(extracted)
+                    continue
+                try:
+                    await database.upsert_cached_extraction(cache_key, model_name, extracted)
+                except Exception as e:
+                    logger.info("Extraction cache unavailable: %s", e)
+                if not fut.done():
+                    fut.set_result(extracted)
+        except Exception as e:
+            for _, _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+
+    # Cache misses are queued and sent EXTRACTION_BATCH_SIZE articles per prompt. A partial batch goes
+    # out once every candidate is settled (queued, answered from cache/duplicates, or dropped), so
+    # nothing waits on articles that won't arrive and early finishers aren't sent one by one
+    pending_batch: list[tuple[str, str, asyncio.Future]] = []
+    batch_tasks: list[asyncio.Task] = []
+    unsettled = len(candidates)
+
+    def _flush_batch():
+        if pending_batch:
+            batch_tasks.append(asyncio.ensure_future(_extract_batch(pending_batch[:])))
+            pending_batch.clear()
+
+    def _settler():
+        # Per-candidate callback; only the first call counts
+        settled = False
+
+        def settle():
+            nonlocal settled, unsettled
+            if settled:
+                return
+            settled = True
+            unsettled -= 1
+            if unsettled == 0:
+                _flush_batch()
+        return settle
+
+    async def _extract(content: str, cache_key: str, settle) -> str:
+        try:
+            try:
+                cached = await database.get_cached_extraction(cache_key)
+            except Exception as e:
+                logger.info("Extraction cache unavailable: %s", e)
+                cached = None
+            if cached is not None:
+                return cached
+            fut = asyncio.get_running_loop().create_future()
+            pending_batch.append((content, cache_key, fut))
+            if len(pending_batch) >= EXTRACTION_BATCH_SIZE:
+                _flush_batch()
+        finally:
+            settle()
+        return await fut
+
+    # Extractions started in this report, indexed by shingle signature; syndicated copies of an
+    # article await the first copy's extraction instead of issuing another LLM call
+    near_dup_index: list[tuple[frozenset, asyncio.Task]] = []
+    # Exact copies are matched by content hash first, so they skip shingling and the SQLite lookup
+    exact_index: dict[str, asyncio.Task] = {}
+
+    async def _extract_dedup(content: str, settle) -> str:
+        # Keyed on the excerpt the prompt actually carries: pages that differ only past it (comment
+        # threads, related-story rails) or in short boilerplate runs share one cached extraction
+        excerpt = truncate_for_prompt(_prompt_prose(content), MAX_PROMPT_CHARS)
+        cache_key = extraction_cache_key(model_name, excerpt)
+        task = exact_index.get(cache_key)
+        if task is not None:
+            settle()
+            return await task
+        sig = shingle_signature(excerpt)
+        for other_sig, other_task in near_dup_index:
+            if shingle_similarity(sig, other_sig) >= NEAR_DUPLICATE_SIMILARITY:
+                exact_index[cache_key] = other_task
+                settle()
+                return await other_task
+        task = asyncio.ensure_future(_extract(excerpt, cache_key, settle))
+        exact_index[cache_key] = task
+        near_dup_index.append((sig, task))
+        return await task
+
+    async def _prepare(result: dict):
+        settle = _settler()
+        try:
+            return await _prepare_one(result, settle)
+        finally:
+            settle()
 
+    async def _prepare_one(result: dict, settle):
+        url = result.get("url", "Not specified")
+        snippet = result.get("content", "No description available")
         # Try to fetch full page text to improve extraction quality and metadata
-        content, raw_html = _fetch_page_content(url, snippet)
+        if SKIP_FETCH_WHEN_SNIPPET_RICH and _is_rich_snippet(snippet):
+            content, raw_html = snippet, None
+        else:
+            content, raw_html = await _fetch_page_content(url, snippet)
+        # Nothing to extract from; such results could never pass the specificity checks below
+        if content == "No description available" or len(content.strip()) < MIN_EXTRACTION_CHARS:
+            logger.debug("Skipping extraction for %s: content too short", url)
+            return None
+        # The keyword verdicts below drop an article whatever the LLM answers, so settle them on the
+        # one lowercased copy before spending a call: hard excludes (annual/quarterly reports, NDB
+        # summaries, lists, webinars, landscape pieces) and general analysis/marketing pieces
+        body_lc = content.lower()
+        content_lc = f"{result.get('title', 'Untitled Incident').lower()} {body_lc}"
+        if contains_any(content_lc, _HARD_EXCLUDE_KW) or contains_any(content_lc, _NON_INCIDENT_KW):
+            logger.debug("Skipping extraction for %s: not a discrete incident", url)
+            return None
+        try:
+            extracted = await _extract_dedup(content, settle)
+        except Exception as e:
+            # Surfaced to the sequential pass, which falls back to the raw content
+            extracted = e
+        return content, content_lc, body_lc, raw_html, extracted
 
-        # Use LLM to extract structured data and summarize the article.
-        extraction_prompt = f'''You are a cybersecurity analyst extracting discrete incident details.
-Return EXACTLY these lines:
-Summary: <one sentence>
-Date of Incident: <YYYY-MM-DD or natural date>
-Targets: <entities>
-Method: <one of [Ransomware, Phishing, Data breach, DDoS, Vulnerability exploitation, Supply chain compromise, Credential stuffing, Business email compromise, Vishing, Malware/Backdoor, Espionage]>
-Exploit Used: <CVE IDs and/or exploit mechanism; leave blank if unknown>
-Incident?: <yes/no> (yes only if a specific incident is described; no for op-eds, legislation, awareness months, and aggregator pages)
-
-If you cannot determine a field from the article, leave that line blank after the colon.
-
-Article: {content}
-'''
+    prepared_all = await asyncio.gather(*(_prepare(r) for r in candidates))
+
+    for result, prepared in zip(candidates, prepared_all):
+        if prepared is None:
+            continue
+        title = result.get("title", "Untitled Incident")
+        url = result.get("url", "Not specified")
+        content, content_lc, body_lc, raw_html, extracted_data = prepared
         try:
-            extracted_data = llm.invoke(extraction_prompt).content
-            summary_match = re.search(r"^Summary:\s*(.*)$", extracted_data, re.MULTILINE)
-            summary = summary_match.group(1).strip() if summary_match else content[:600] + "..."
+            if isinstance(extracted_data, Exception):
+                raise extracted_data
+            fields = _parse_extraction(extracted_data)
+            summary = fields["summary"].strip() if fields["summary"] is not None else _prompt_prose(content)[:600] + "..."
             summary = _sanitize_summary(summary)
 
-            date_match = re.search(r"^Date of Incident:\s*(.*)$", extracted_data, re.MULTILINE)
-            date = _sanitize_date_field(date_match.group(1).strip() if date_match else "Not specified")
+            date = _sanitize_date_field(fields["date"].strip() if fields["date"] is not None else "Not specified")
             
-            targets_match = re.search(r"^Targets:\s*(.*)$", extracted_data, re.MULTILINE)
-            targets = _sanitize_field(targets_match.group(1) if targets_match else "Not specified")
+            targets = _sanitize_field(fields["targets"] if fields["targets"] is not None else "Not specified")
             
-            method_match = re.search(r"^Method:\s*(.*)$", extracted_data, re.MULTILINE)
-            raw_method = method_match.group(1) if method_match else "Not specified"
+            raw_method = fields["method"] if fields["method"] is not None else "Not specified"
             method = _normalize_method(_sanitize_field(raw_method))
 
-            exploit_match = re.search(r"^Exploit Used:\s*(.*)$", extracted_data, re.MULTILINE)
-            exploit_used_llm = _sanitize_field(exploit_match.group(1) if exploit_match else "")
+            exploit_used_llm = _sanitize_field(fields["exploit"] if fields["exploit"] is not None else "")
 
-            incident_match = re.search(r"Incident\?:\s*(yes|no)", extracted_data, re.IGNORECASE)
-            is_incident = bool(incident_match and incident_match.group(1).lower() == "yes")
+            is_incident = fields["incident"]
         except Exception as e:
             logger.error(f"Error extracting data from LLM: {e}")
-            summary = content[:600] + "..."
+            summary = _sanitize_summary(_prompt_prose(content)[:600] + "...")
             date = "Not specified"
             targets = "Not specified"
             method = "Not specified"
@@ -877,7 +1698,7 @@ Article: {content}
                 date = meta_date
         # If still not specified, try to extract a date from text
         if is_incident and date == "Not specified":
-            text_date = _extract_date_from_text(content)
+            text_date = _first_text_date(content)
             if text_date:
                 date = text_date
         # If still not specified, try to extract a date from the URL
@@ -902,18 +1723,12 @@ Article: {content}
             if not _within_range(ds, de, range_start, range_end):
                 continue
 
-        # Heuristic classification: keep only specific, discrete incidents
-        content_lc = f"{title} {content}".lower()
-        # Hard excludes: annual/quarterly reports, NDB summaries, lists, webinars, landscape pieces
-        if _is_hard_exclude(title, content):
-            continue
-        if any(nk in content_lc for nk in non_incident_keywords):
-            # Do not salvage if it looks like a general analysis/marketing/landscape piece
-            continue
+        # Heuristic classification: keep only specific, discrete incidents (hard excludes and
+        # non-incident pieces were already dropped before extraction)
         # LLM must say it's an incident
         if not is_incident:
             # Only salvage when there are strong indicators and sufficient specificity
-            has_signal = any(kw in content_lc for kw in incident_keywords)
+            has_signal = contains_any(content_lc, _INCIDENT_KW)
             has_date = (date and date.lower() != "not specified")
             has_specific_target = _is_specific_target(targets)
             has_method = (method and method.lower() != "not specified")
@@ -925,12 +1740,12 @@ Article: {content}
             continue
         # Additional guard on titles that scream lists/overviews
         title_lc = title.lower()
-        if any(nk in title_lc for nk in ("top ", "landscape", "trends", "webinar", "overview", "battle", "threats in")):
+        if contains_any(title_lc, _OVERVIEW_TITLE_KW):
             continue
 
         # Infer method from text if missing (for incidents)
         if is_incident and method == "Not specified":
-            inferred = _infer_method_from_text(content)
+            inferred = _infer_method_from_text(body_lc)
             method = inferred
         # Method may be unknown; we will omit it from output
 
@@ -943,35 +1758,14 @@ Article: {content}
 
         # Date may be unknown; we will omit if unknown
 
-        # Sanitize final date value to avoid malformed lines
-        date = _sanitize_date_field(date)
+        # Sanitize final date value to avoid malformed lines. The LLM value was sanitized on the way
+        # in and the text/URL fallbacks yield ISO days, so only a partial metadata date (YYYY-MM
+        # or YYYY) still needs the pass
+        if date != "Not specified" and not _ISO_DAY_RE.fullmatch(date):
+            date = _sanitize_date_field(date)
 
         # Improved relevance
-        relevance = "Relevant to Australian businesses due to potential impact on similar industries or supply chains"
-        tlc = title.lower()
-        clc = content.lower()
-        # Specific relevance for Microsoft PipeMagic zero-day (CVE-2025-29824)
-        if (
-            "pipemagic" in tlc or "pipemagic" in clc or
-            "cve-2025-29824" in (raw_html or "") .lower() or "cve-2025-29824" in clc or
-            "clfs" in clc
-        ):
-            relevance = (
-                "Shows attackers rapidly weaponizing new Microsoft zero-days for ransomware. "
-                "Highlights that Australian businesses must apply security updates immediately; "
-                "any unpatched Windows servers could be hijacked via PipeMagic as soon as patches are released"
-            )
-        # Trigger direct Qantas impact only when in title or targets
-        elif "qantas" in (tlc + " " + targets.lower()):
-            relevance = "Directly impacts Qantas, a major Australian airline, affecting customer trust and compliance."
-        elif "government" in clc:
-            relevance = "Affects Australian government operations and public sector data security."
-        elif "superannuation" in clc:
-            relevance = "Impacts Australia’s superannuation industry, critical for financial security."
-        elif "university" in clc:
-            relevance = "Impacts Australian educational institutions, affecting data security and operations."
-        elif "australian sectors" in content or "australia" in content:
-            relevance = "Impacts Australian businesses across multiple sectors, increasing cybersecurity risks."
+        relevance = _classify_relevance(title, content, targets=targets, raw_html=raw_html)
         
         # Note speculative data for 2025
         if "2025" in date:
@@ -995,21 +1789,10 @@ Article: {content}
         raw_text_source = raw_html if raw_html else content
         cves = _extract_cves(raw_text_source)
         if cves:
-            # Avoid duplicate CVEs already present in exploit_used_llm
-            existing = " ".join(exploit_parts).upper()
-            # Decorate known CVEs with friendly labels
-            cve_labels = {
-                "CVE-2025-29824": "(now-patched Windows 0-day)"
-            }
-            addl = []
-            for c in cves:
-                u = c.upper()
-                if u in existing:
-                    continue
-                label = cve_labels.get(u, "")
-                addl.append(f"{u} {label}".strip())
+            # Avoid duplicate CVEs already present in exploit_used_llm; known CVEs get friendly labels
+            addl = _format_cves(cves, " ".join(exploit_parts))
             if addl:
-                exploit_parts.append(", ".join(addl))
+                exploit_parts.append(addl)
         if exploit_parts:
             details.append(f"- Exploit Used: {'; '.join(exploit_parts)}")
         # Add relevance and source
@@ -1020,100 +1803,76 @@ Article: {content}
             details.append(f"- Source: [{title}]({url})")
 
         # Track used URL (canonical form) to avoid duplicates and to support backfill
-        try:
-            pu = urlparse(url)
-            canon_url = f"{pu.scheme}://{pu.netloc}{pu.path}".rstrip("/")
-        except Exception:
-            canon_url = (url or "").strip()
-        used_urls.add(canon_url.lower())
+        used_urls.add(_result_canon(result))
 
         # Append section using new style; include HTML breaks for email, UI will sanitize
-        output += f"## {included}. {title}\n\n**{summary}**\n\n{os.linesep.join(details)}\n\n<br><br>\n\n"
+        parts.append(f"## {included}. {title}\n\n**{summary}**\n\n{os.linesep.join(details)}\n\n<br><br>\n\n")
     # Backfill in relaxed mode to reach minimum target when strict filtering yields too few items
     if included < MIN_RESULTS_ENFORCED:
         needed = MIN_RESULTS_ENFORCED - included
         added = 0
-        for result in results:
-            if added >= needed:
-                break
-            title = result.get("title", "Untitled")
-            url = result.get("url", "")
-            # Skip duplicates and homepages
-            try:
-                pu = urlparse(url)
-                canon_url = f"{pu.scheme}://{pu.netloc}{pu.path}".rstrip("/")
-            except Exception:
-                canon_url = (url or "").strip()
-            if not canon_url or canon_url.lower() in used_urls:
-                continue
-            if 'pu' in locals() and getattr(pu, 'path', None) in ("", "/"):
-                continue
-            # Fetch content (fallback to snippet)
-            snippet = result.get("content", "")
-            content, raw_html = _fetch_page_content(url, snippet)
-            # Try to infer a date from metadata/url for range filtering
-            bf_date = _extract_metadata_date(raw_html) or _extract_date_from_url(url) or "Not specified"
-            if range_start or range_end:
-                ds, de = _normalize_date_for_filter(bf_date)
-                if ds and de and not _within_range(ds, de, range_start, range_end):
-                    # If we have a date and it's clearly outside, skip
+        # Skip duplicates and homepages (canonical form has no path separator for a bare homepage)
+        backfill_queue = [
+            r for r in results
+            if (c := _result_canon(r)) and c not in used_urls and "/" in c
+        ]
+        # Fetch pages (falling back to snippets) a window at a time, concurrently within the window;
+        # a window is only as large as the slots still open, so no page is pulled that can't be used
+        while backfill_queue and added < needed:
+            window = backfill_queue[:needed - added]
+            del backfill_queue[:len(window)]
+            fetched = await asyncio.gather(*(_fetch_page_content(r.get("url", ""), r.get("content", "")) for r in window))
+            for result, (content, raw_html) in zip(window, fetched):
+                title = result.get("title", "Untitled")
+                url = result.get("url", "")
+                canon_url = _result_canon(result)
+                if canon_url in used_urls:
                     continue
-            # Build fields with heuristics
-            summary = _sanitize_summary(content[:600] + ("..." if len(content) > 600 else ""))
-            date_str = _sanitize_date_field(bf_date)
-            pretty = _pretty_date(date_str)
-            targets = _infer_targets_from_title(title) or "Not specified"
-            method = _infer_method_from_text(content)
-            # Exploits/CVEs
-            exploit_parts = []
-            cves = _extract_cves(raw_html if raw_html else content)
-            if cves:
-                cve_labels = {
-                    "CVE-2025-29824": "(now-patched Windows 0-day)"
-                }
-                expl_list = []
-                for c in cves:
-                    label = cve_labels.get(c.upper(), "")
-                    expl_list.append(f"{c.upper()} {label}".strip())
-                if expl_list:
-                    exploit_parts.append(", ".join(expl_list))
-            # Relevance
-            tlc = title.lower(); clc = content.lower()
-            relevance = "Relevant to Australian businesses due to potential impact on similar industries or supply chains"
-            if ("pipemagic" in tlc or "pipemagic" in clc or "cve-2025-29824" in clc or "clfs" in clc):
-                relevance = (
-                    "Shows attackers rapidly weaponizing new Microsoft zero-days for ransomware. "
-                    "Highlights that Australian businesses must apply security updates immediately; "
-                    "any unpatched Windows servers could be hijacked via PipeMagic as soon as patches are released"
-                )
-            elif "government" in clc:
-                relevance = "Affects Australian government operations and public sector data security."
-            elif "university" in clc:
-                relevance = "Impacts Australian educational institutions, affecting data security and operations."
-
-            # Assemble details, omitting unknowns
-            details = []
-            if pretty and pretty.lower() != "not specified":
-                details.append(f"- Date of Incident: {pretty}")
-            if targets and targets != "Not specified":
-                details.append(f"- Targets: {targets}")
-            if method and method != "Not specified":
-                details.append(f"- Method: {method}")
-            if exploit_parts:
-                details.append(f"- Exploit Used: {'; '.join(exploit_parts)}")
-            if relevance:
-                details.append(f"- Relevance: {relevance}")
-            if url:
-                details.append(f"- Source: [{title}]({url})")
-
-            included += 1
-            added += 1
-            used_urls.add(canon_url.lower())
-            output += f"## {included}. {title}\n\n**{summary}**\n\n{os.linesep.join(details)}\n\n<br><br>\n\n"
+                # Try to infer a date from metadata/url for range filtering
+                bf_date = _extract_metadata_date(raw_html) or _extract_date_from_url(url) or "Not specified"
+                if range_start or range_end:
+                    ds, de = _normalize_date_for_filter(bf_date)
+                    if ds and de and not _within_range(ds, de, range_start, range_end):
+                        # If we have a date and it's clearly outside, skip
+                        continue
+                # Build fields with heuristics
+                prose = _prompt_prose(content)
+                summary = _sanitize_summary(prose[:600] + ("..." if len(prose) > 600 else ""))
+                date_str = _sanitize_date_field(bf_date)
+                pretty = _pretty_date(date_str)
+                targets = _infer_targets_from_title(title) or "Not specified"
+                method = _infer_method_from_text(content.lower())
+                # Exploits/CVEs
+                exploit_parts = []
+                cves = _extract_cves(raw_html if raw_html else content)
+                if cves:
+                    exploit_parts.append(_format_cves(cves))
+                # Relevance (backfill items only get the core signals)
+                relevance = _classify_relevance(title, content, extended=False)
+
+                # Assemble details, omitting unknowns
+                details = []
+                if pretty and pretty.lower() != "not specified":
+                    details.append(f"- Date of Incident: {pretty}")
+                if targets and targets != "Not specified":
+                    details.append(f"- Targets: {targets}")
+                if method and method != "Not specified":
+                    details.append(f"- Method: {method}")
+                if exploit_parts:
+                    details.append(f"- Exploit Used: {'; '.join(exploit_parts)}")
+                if relevance:
+                    details.append(f"- Relevance: {relevance}")
+                if url:
+                    details.append(f"- Source: [{title}]({url})")
+
+                included += 1
+                added += 1
+                used_urls.add(canon_url)
+                parts.append(f"## {included}. {title}\n\n**{summary}**\n\n{os.linesep.join(details)}\n\n<br><br>\n\n")
 
     if enforce_min and included < MIN_RESULTS_ENFORCED:
-        output += f"\nOnly [{included}] relevant cybersecurity incidents found for the requested timeframe (target: {MIN_RESULTS_ENFORCED})."
-    return output
+        parts.append(f"\nOnly [{included}] relevant cybersecurity incidents found for the requested timeframe (target: {MIN_RESULTS_ENFORCED}).")
+    return "".join(parts)
 
 # Main function for testing
 if __name__ == "__main__":
@@ -1126,21 +1885,15 @@ if __name__ == "__main__":
         print(f"Generation time: {generation_time:.2f} seconds")
     asyncio.run(main())
 
-def format_investigation_results(query, results, llm):
-    # Extract content and URLs from results
-    formatted_results = ""
-    for result in results:
-        formatted_results += f"URL: {result.get('url', 'N/A')}\nContent: {result.get('content', 'N/A')}\n\n"
-
-    prompt = f"""
+INVESTIGATION_SYSTEM_PROMPT = """
     As a senior cybersecurity analyst, your task is to produce a detailed and well-structured threat intelligence report based on the provided web search results. The report should be written in Markdown format and follow the structure below.
 
-    **Objective:** Synthesize the provided data into a comprehensive report on the cybersecurity incident: "{query}".
+    **Objective:** Synthesize the provided data into a comprehensive report on the cybersecurity incident named in the user message.
 
     **Report Structure:**
 
     1.  **Heading:**
-        - Create a clear, concise heading for the report (e.g., `# {query} Research`).
+        - Create a clear, concise heading for the report (e.g., `# <incident> Research`).
 
     2.  **Incident Overview:**
         - **Who & When:**
@@ -1174,9 +1927,7 @@ def format_investigation_results(query, results, llm):
     5.  **References:**
         - List all the source URLs provided in the search results.
 
-    **Input Data:**
-
-    {formatted_results}
+    The search results are provided in the user message as the Input Data.
 
     ---
     **Instructions:**
@@ -1186,8 +1937,24 @@ def format_investigation_results(query, results, llm):
     - The final output must be a single, well-formatted Markdown document.
     """
 
-    # Invoke the LLM with the detailed prompt
-    response = llm.invoke(prompt)
+async def format_investigation_results(query, results, llm):
+    # Extract content and URLs from results; each body gets the same bounded excerpt as the
+    # extraction prompts so one long page can't dominate the prefill
+    formatted_results = "".join(
+        f"URL: {result.get('url', 'N/A')}\n"
+        f"Content: {truncate_for_prompt(result.get('content') or 'N/A', MAX_PROMPT_CHARS)}\n\n"
+        for result in results
+    )
+
+    # Static report template goes in the system message so the server can reuse its KV prefix
+    # across investigations; only the query and search results change per call
+    messages = [
+        ("system", INVESTIGATION_SYSTEM_PROMPT),
+        ("human", f'Incident: "{query}"\n\n**Input Data:**\n\n{formatted_results}'),
+    ]
+
+    # Invoke the LLM (native async call; no worker thread held for the generation)
+    response = await llm.ainvoke(messages)
     return response.content
 
 async def investigate(query: str, server_name: str = None, model_name: str = "granite3.3", server_type: str = "ollama"):
@@ -1199,69 +1966,43 @@ async def investigate(query: str, server_name: str = None, model_name: str = "gr
         server_url_or_key = None
 
         if server_type == "ollama":
-            if server_name:
-                selected_server = await database.get_ollama_server_by_name(server_name)
-            if not selected_server:
-                all_servers = await database.get_ollama_servers()
-                if all_servers:
-                    selected_server = all_servers[0]
-                else:
-                    raise ValueError("No Ollama servers configured.")
+            selected_server = await _resolve_server("ollama", server_name)
             server_url_or_key = selected_server['url']
-            llm = ChatOllama(
-                model=model_name,
-                temperature=0,
-                api_key=os.environ.get("OPENROUTER_API_KEY"),
-                base_url=server_url_or_key.replace("/api/generate", "/")
-            )
-            # Test connection to the selected Ollama server using async HTTP client
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{server_url_or_key.replace('/api/generate', '')}/api/tags")
-                if response.status_code != 200:
-                    raise ConnectionError(f"Failed to connect to Ollama server at {server_url_or_key}")
+            llm = get_ollama_llm(server_url_or_key.replace("/api/generate", "/"), model_name)
         elif server_type == "gemini":
-            if server_name:
-                selected_server = await database.get_external_ai_server_by_name(server_name)
-            if not selected_server:
-                all_servers = await database.get_external_ai_servers()
-                if all_servers:
-                    selected_server = all_servers[0]
-                else:
-                    raise ValueError("No Gemini servers configured.")
+            selected_server = await _resolve_server("gemini", server_name)
             server_url_or_key = selected_server['api_key']
-            llm = ChatGoogleGenerativeAI(
-                model=f"models/gemini-2.5-flash",
-                temperature=0,
-                google_api_key=server_url_or_key
-            )
+            llm = get_gemini_llm(server_url_or_key)
         else:
             raise ValueError(f"Unsupported server type: {server_type}")
 
-        # Get raw results: SERPAPI primary, Tavily fallback (unrestricted)
-        import asyncio
-        raw_results = {"results": []}
+        # Probe the Ollama server (cached for OLLAMA_HEALTH_TTL_S) while the search APIs are in flight
+        health_task = asyncio.create_task(_check_ollama_server(server_url_or_key)) if server_type == "ollama" else None
+
         try:
-            if serpapi_api_key:
-                extra = {"tbm": "nws"}
-                raw_results = await asyncio.get_event_loop().run_in_executor(None, _search_serpapi, query, 100, "au", "en", extra)
-                logger.info("Raw SERPAPI results retrieved")
-        except Exception as e:
-            logger.warning(f"SERPAPI search failed for investigate, trying Tavily fallback: {e}")
-        if (not raw_results.get("results")) and tavily_api_key:
+            # Get raw results: SERPAPI primary, Tavily fallback (unrestricted)
+            raw_results = {"results": []}
             try:
-                tavily_tool_unrestricted = TavilySearch(
-                    max_results=15,
-                    topic="general",
-                    search_depth="advanced",
-                )
-                raw_results = await asyncio.get_event_loop().run_in_executor(None, tavily_tool_unrestricted.invoke, query)
-                logger.info("Raw Tavily results retrieved (fallback)")
+                if serpapi_api_key:
+                    extra = {"tbm": "nws"}
+                    raw_results = await _search_serpapi(query, 100, "au", "en", extra)
+                    logger.info("Raw SERPAPI results retrieved")
             except Exception as e:
-                logger.error(f"Tavily fallback failed for investigate: {e}")
+                logger.warning(f"SERPAPI search failed for investigate, trying Tavily fallback: {e}")
+            if (not raw_results.get("results")) and tavily_api_key:
+                try:
+                    raw_results = await _search_tavily(query, 15)
+                    logger.info("Raw Tavily results retrieved (fallback)")
+                except Exception as e:
+                    logger.error(f"Tavily fallback failed for investigate: {e}")
+            if health_task is not None:
+                await health_task
+        finally:
+            # A failed or cancelled search must not leave the probe running unobserved
+            _discard_task(health_task)
 
         # Generate the detailed investigation report
-        # Run the formatting in a thread pool to avoid blocking
-        output = await asyncio.get_event_loop().run_in_executor(None, format_investigation_results, query, raw_results.get("results", []), llm)
+        output = await format_investigation_results(query, raw_results.get("results", []), llm)
 
         if not output.strip():
             logger.warning("No relevant results found")
@@ -1270,7 +2011,7 @@ async def investigate(query: str, server_name: str = None, model_name: str = "gr
         overall_end_time = time.time()
         generation_time = overall_end_time - overall_start_time
 
-        await database.add_research(query, output, generation_time, selected_server['name'], model_name)
+        _spawn_background(database.add_research(query, output, generation_time, selected_server['name'], model_name))
         return output, generation_time
     except Exception as e:
         logger.error(f"Error processing query: {str(e)}")
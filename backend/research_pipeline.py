@@ -1,6 +1,5 @@
 import asyncio
 import logging
-import httpx
 import re
 import hashlib
 from urllib.parse import urlparse
@@ -10,6 +9,17 @@ import database
 import research
 import utils
 
+# Readability (main-content summary) and lxml are optional; pages fall back to the regex strip
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # pragma: no cover
+    etree = None
+try:
+    from readability import Document  # type: ignore
+except ImportError:  # pragma: no cover
+    Document = None
+
 # API-free discovery providers (import relative to backend working dir)
 try:
     from discovery import rss_provider, sitemap_provider, domain_crawler
@@ -28,6 +38,13 @@ JOB_STREAMS: dict[int, asyncio.Queue] = {}
 # on nodes that may reference it inadvertently.
 accept_all: bool = False
 
+# Text-cleanup patterns used per fetched page and per LLM reply, compiled once
+_NON_WORD_RE = re.compile(r"\W+")
+_CODE_FENCE_OPEN_RE = re.compile(r"^```(?:json)?")
+_CODE_FENCE_CLOSE_RE = re.compile(r"```$")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+_SNIPPET_HEADING_NUM_RE = re.compile(r"^##\s*\d+\.", re.MULTILINE)
+
 def _canon_url(url: str) -> str:
     try:
         pu = urlparse(url)
@@ -36,27 +53,39 @@ def _canon_url(url: str) -> str:
         return (url or "").strip()
 
 def _title_key(title: str) -> str:
-    return re.sub(r"\W+", "", (title or "").lower())[:100]
+    return _NON_WORD_RE.sub("", (title or "").lower())[:100]
 
 def _content_hash(text: str) -> str:
     return hashlib.sha1((text or "").encode('utf-8')).hexdigest()
 
+# Path and keyword lists, probed with research.contains_any
+_NON_ARTICLE_PATH_KW = research.keywords((
+    "/tag/", "/category/", "/author/", "/contributor/", "/contributors/",
+    "/topic/", "/topics/", "/resource/", "/resources/", "/podcast", "/cybercast",
+    "/privacy", "/terms", "/contact", "/about", "/cdn-cgi/", "/feed", "/page/"
+))
+_ARTICLE_PATH_KW = research.keywords(("/article/", "/news/", "/brief/", "/blog/", "/stories/", "/story/"))
+_YEAR_SEGMENT_RE = re.compile(r"/20\d{2}/")
+_BUSINESS_KW = research.keywords((
+    "business", "businesses", "company", "companies", "organisation", "organization",
+    "enterprise", "sector", "industry", "sme", "smb"
+))
+_AU_RELEVANCE_KW = research.keywords(("australia", ".au", "australian"))
+_PLATFORM_RELEVANCE_KW = research.keywords((
+    "windows", "apple", "ios", "macos", "azure", "aws", "google cloud", "vmware", "esxi"
+))
+
 def _is_article_url(url: str) -> bool:
     try:
         pu = urlparse(url)
         path = (pu.path or "/").lower()
         # Exclude obvious non-article paths
-        bad_parts = (
-            "/tag/", "/category/", "/author/", "/contributor/", "/contributors/",
-            "/topic/", "/topics/", "/resource/", "/resources/", "/podcast", "/cybercast",
-            "/privacy", "/terms", "/contact", "/about", "/cdn-cgi/", "/feed", "/page/"
-        )
-        if any(bp in path for bp in bad_parts):
+        if research.contains_any(path, _NON_ARTICLE_PATH_KW):
             return False
         # Allow likely articles: contain year segments or article/news keywords
-        if re.search(r"/20\d{2}/", path):
+        if _YEAR_SEGMENT_RE.search(path):
             return True
-        if any(k in path for k in ("/article/", "/news/", "/brief/", "/blog/", "/stories/", "/story/")):
+        if research.contains_any(path, _ARTICLE_PATH_KW):
             return True
         # Otherwise allow if path has 3+ segments and ends not with a slash
         segs = [s for s in path.strip('/').split('/') if s]
@@ -84,6 +113,18 @@ async def _push_event(job_id: int, payload: dict):
         except Exception:
             pass
 
+def _page_text(html: str) -> str:
+    # Try readability extraction for main content, walking its text nodes in C
+    if Document is not None and etree is not None:
+        try:
+            root = lxml.html.fromstring(Document(html).summary() or html)
+            etree.strip_elements(root, "script", "style", with_tail=False)
+            return " ".join(" ".join(root.itertext()).split())
+        except Exception:
+            pass
+    # Without readability, research's page text (lxml, then regex strip) minus its block breaks
+    return " ".join(research.html_to_text(html).split())
+
 async def _http_get_text(url: str, *, etag: str | None = None, last_modified: str | None = None) -> tuple[str, str | None, dict | None]:
     try:
         headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
@@ -91,37 +132,23 @@ async def _http_get_text(url: str, *, etag: str | None = None, last_modified: st
             headers["If-None-Match"] = etag
         if last_modified:
             headers["If-Modified-Since"] = last_modified
-        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-            resp = await client.get(url, headers=headers)
+        # Pooled client shared with research.py, so repeat hosts skip the TCP/TLS handshake
+        client = research.get_http_client()
+        # Streamed and capped at research_limits.max_page_bytes, like research.py's article fetches
+        async with client.stream("GET", url, headers=headers, timeout=10.0, follow_redirects=True) as resp:
             if resp.status_code != 200:
                 return "", None, {"status": resp.status_code}
-            html = resp.text
-            # Try readability extraction for main content
-            text = ""
-            try:
-                from readability import Document  # type: ignore
-                doc = Document(html)
-                summary_html = doc.summary() or html
-                clean = re.sub(r"(?is)<script[^>]*>.*?</script>", " ", summary_html)
-                clean = re.sub(r"(?is)<style[^>]*>.*?</style>", " ", clean)
-                text = re.sub(r"(?is)<[^>]+>", " ", clean)
-                text = re.sub(r"\s+", " ", text).strip()
-            except Exception:
-                # Fallback to naive stripping
-                clean = re.sub(r"(?is)<script[^>]*>.*?</script>", " ", html)
-                clean = re.sub(r"(?is)<style[^>]*>.*?</style>", " ", clean)
-                clean = re.sub(r"(?is)<nav[^>]*>.*?</nav>", " ", clean)
-                clean = re.sub(r"(?is)<header[^>]*>.*?</header>", " ", clean)
-                clean = re.sub(r"(?is)<footer[^>]*>.*?</footer>", " ", clean)
-                text = re.sub(r"(?is)<[^>]+>", " ", clean)
-                text = re.sub(r"\s+", " ", text).strip()
+            html = await research.read_page_capped(resp)
             meta = {
                 "status": resp.status_code,
                 "etag": resp.headers.get('ETag'),
                 "last_modified": resp.headers.get('Last-Modified'),
-                "bytes": len(resp.content or b'') if hasattr(resp, 'content') else len(html.encode('utf-8', errors='ignore')),
+                "bytes": resp.num_bytes_downloaded or len(html),
             }
-            return text, html, meta
+        # Readability/lxml hold the CPU for tens of milliseconds per page; a worker thread keeps the
+        # job's other fetches and LLM calls moving (same as research.py's article parse)
+        text = await asyncio.to_thread(_page_text, html)
+        return text, html, meta
     except Exception:
         return "", None, None
 
@@ -129,7 +156,7 @@ def _extract_cves(text: str) -> list[str]:
     if not text:
         return []
     try:
-        m = re.findall(r"\bCVE-\d{4}-\d{4,7}\b", text, flags=re.IGNORECASE)
+        m = research.CVE_RE.findall(text)
         out, seen = [], set()
         for c in m:
             u = c.upper()
@@ -140,8 +167,46 @@ def _extract_cves(text: str) -> list[str]:
     except Exception:
         return []
 
+# LLM method labels mapped onto the report's classes, first matching substring wins
+_METHOD_ALIASES = (
+    ("ransom", "Ransomware"),
+    ("lockbit", "Ransomware"),
+    ("double", "Ransomware"),
+    ("extortion", "Ransomware"),
+    ("data breach", "Data breach"),
+    ("breach", "Data breach"),
+    ("leak", "Data breach"),
+    ("exfil", "Data breach"),
+    ("phishing", "Phishing"),
+    ("credential", "Credential stuffing"),
+    ("ddos", "DDoS"),
+    ("denial", "DDoS"),
+    ("vulnerability", "Vulnerability exploitation"),
+    ("exploit", "Vulnerability exploitation"),
+    ("sql", "Vulnerability exploitation"),
+    ("supply", "Supply chain compromise"),
+    ("third", "Supply chain compromise"),
+    ("bec", "Business email compromise"),
+    ("business email", "Business email compromise"),
+    ("vishing", "Vishing"),
+    ("voice", "Vishing"),
+    ("backdoor", "Malware/Backdoor"),
+    ("malware", "Malware/Backdoor"),
+    ("espionage", "Espionage"),
+)
+
+def _norm_method(m: str) -> str:
+    t = (m or "").strip().lower()
+    for k, v in _METHOD_ALIASES:
+        if k in t:
+            return v
+    return "" if not t else m
+
 async def _extract_fields_with_llm(llm, content: str, prompt_template: str | None = None, timeout_s: float | None = None) -> dict:
     """Ask the LLM for strict JSON and parse it. Fallback to a naive summary on failure."""
+    # The lead carries the incident facts; the prompt gets the same bounded excerpt as research.py
+    # (research_limits.max_prompt_chars) rather than the whole readability text
+    excerpt = research.truncate_for_prompt(content or "", research.MAX_PROMPT_CHARS)
     schema = {
         "summary": "string",
         "date": "string",
@@ -151,7 +216,7 @@ async def _extract_fields_with_llm(llm, content: str, prompt_template: str | Non
         "incident": "boolean"
     }
     if prompt_template and isinstance(prompt_template, str) and prompt_template.strip():
-        prompt = prompt_template.replace("{ARTICLE}", content)
+        prompt = prompt_template.replace("{ARTICLE}", excerpt)
     else:
         prompt = (
             "You are a cybersecurity analyst focused on incidents impacting Australian businesses.\n"
@@ -160,52 +225,35 @@ async def _extract_fields_with_llm(llm, content: str, prompt_template: str | Non
             "Rules: method must be one of [Ransomware, Phishing, Data breach, DDoS, Vulnerability exploitation, Supply chain compromise, Credential stuffing, Business email compromise, Vishing, Malware/Backdoor, Espionage]. "
             "Set incident=true only if this article describes an actual cyberattack/breach/exploit/outage affecting an organization, or a high-likelihood threat relevant to Australian businesses. "
             "Prefer concise, factual summary. Leave unknown fields as empty string. No prose or markdown, JSON only.\n\n"
-            f"Article: {content}"
+            f"Article: {excerpt}"
         )
+    # Same extraction_cache table as research.py; the full prompt is hashed so custom templates key separately
+    model_name = getattr(llm, "model", "") or ""
+    cache_key = research.extraction_cache_key(model_name, "pipeline\0" + prompt)
     try:
-        loop = asyncio.get_event_loop()
-        fut = loop.run_in_executor(None, llm.invoke, prompt)
-        resp = await (asyncio.wait_for(fut, timeout=timeout_s) if timeout_s and timeout_s > 0 else fut)
-        raw = resp.content
-        # Trim code fences if present
-        raw = raw.strip()
-        if raw.startswith("```"):
-            raw = re.sub(r"^```(?:json)?", "", raw).strip()
-            raw = re.sub(r"```$", "", raw).strip()
-        data = json.loads(raw)
-        # Normalize
-        def _norm_method(m: str) -> str:
-            t = (m or "").strip().lower()
-            mapping = {
-                "ransom": "Ransomware",
-                "lockbit": "Ransomware",
-                "double": "Ransomware",
-                "extortion": "Ransomware",
-                "data breach": "Data breach",
-                "breach": "Data breach",
-                "leak": "Data breach",
-                "exfil": "Data breach",
-                "phishing": "Phishing",
-                "credential": "Credential stuffing",
-                "ddos": "DDoS",
-                "denial": "DDoS",
-                "vulnerability": "Vulnerability exploitation",
-                "exploit": "Vulnerability exploitation",
-                "sql": "Vulnerability exploitation",
-                "supply": "Supply chain compromise",
-                "third": "Supply chain compromise",
-                "bec": "Business email compromise",
-                "business email": "Business email compromise",
-                "vishing": "Vishing",
-                "voice": "Vishing",
-                "backdoor": "Malware/Backdoor",
-                "malware": "Malware/Backdoor",
-                "espionage": "Espionage",
-            }
-            for k, v in mapping.items():
-                if k in t:
-                    return v
-            return "" if not t else m
+        try:
+            raw = await database.get_cached_extraction(cache_key)
+        except Exception as e:
+            logger.info("Extraction cache unavailable: %s", e)
+            raw = None
+        cached = raw is not None
+        if not cached:
+            # Native async call: no worker-thread hop, and a timeout cancels the request itself
+            coro = llm.ainvoke(prompt)
+            resp = await (asyncio.wait_for(coro, timeout=timeout_s) if timeout_s and timeout_s > 0 else coro)
+            raw = resp.content
+            # Trim code fences if present
+            raw = raw.strip()
+            if raw.startswith("```"):
+                raw = _CODE_FENCE_OPEN_RE.sub("", raw).strip()
+                raw = _CODE_FENCE_CLOSE_RE.sub("", raw).strip()
+        data = research.json_loads(raw)
+        if not cached:
+            # Only replies that parsed are cached, so a malformed answer is retried next run
+            try:
+                await database.upsert_cached_extraction(cache_key, model_name, raw)
+            except Exception as e:
+                logger.info("Extraction cache unavailable: %s", e)
         out = {
             "summary": (data.get("summary") or "").strip(),
             "date": (data.get("date") or "").strip(),
@@ -226,16 +274,17 @@ async def _extract_fields_with_llm(llm, content: str, prompt_template: str | Non
             "incident": False,
         }
 
+_ISO_DATE_PARTS_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
 def _pretty_date(date_str: str) -> str:
     if not date_str:
         return ""
     s = date_str.strip()
     try:
-        m = re.fullmatch(r"(\d{4})-(\d{2})-(\d{2})", s)
+        m = _ISO_DATE_PARTS_RE.fullmatch(s)
         if m:
             y, mo, d = int(m.group(1)), int(m.group(2)), int(m.group(3))
-            months = ["January","February","March","April","May","June","July","August","September","October","November","December"]
-            return f"{months[mo-1]} {d}, {y}"
+            return f"{research.MONTH_NAMES[mo-1]} {d}, {y}"
     except Exception:
         pass
     return s
@@ -275,12 +324,11 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
     try:
         if server_type == 'ollama':
             server = await database.get_ollama_server_by_name(server_name)
-            from langchain_ollama import ChatOllama
-            llm = ChatOllama(model=model_name, temperature=0, base_url=server['url'].replace('/api/generate', '/'))
+            # Shared per (base_url, model) with perform_search/investigate so the HTTP pool stays warm
+            llm = research.get_ollama_llm(server['url'].replace('/api/generate', '/'), model_name)
         elif server_type == 'gemini':
             server = await database.get_external_ai_server_by_name(server_name)
-            from langchain_google_genai import ChatGoogleGenerativeAI
-            llm = ChatGoogleGenerativeAI(model='models/gemini-2.5-flash', temperature=0, google_api_key=server['api_key'])
+            llm = research.get_gemini_llm(server['api_key'])
     except Exception as e:
         await _push_log(job_id, 'error', f"Failed to initialize LLM: {e}")
         await database.update_research_job(job_id, status='failed', finished_at=datetime.utcnow())
@@ -340,6 +388,7 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
     # Domains
     include_domains_override = job_cfg.get('domains', {}).get('include') if isinstance(job_cfg.get('domains', {}), dict) else None
     include_domains = include_domains_override if include_domains_override else (allowlist_domains_cfg or research.include_domains)
+    include_domain_set = frozenset(d.strip().lower() for d in include_domains if d)
     seen: set[str] = set()
     total_seen = 0
 
@@ -354,6 +403,10 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
             _page_cache.pop(next(iter(_page_cache)))
         _page_cache[_canon_url(url).lower()] = value
 
+    # Extractions started in this job, keyed by the shingle signature of the prompt excerpt:
+    # syndicated copies of one story reuse the first copy's extraction instead of another LLM call
+    near_dup_extractions: list[tuple[frozenset, asyncio.Task]] = []
+
     # Per-domain rate limiting and domain counters
     import time as _time
     domain_locks: dict[str, asyncio.Lock] = {}
@@ -410,9 +463,12 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
         "explainer","guide","landscape","overview","predictions","trends","report"
     )
 
-    def _is_low_signal(text: str) -> bool:
-        tl = (text or "").lower()
-        return any(k in tl for k in aggregator_kw)
+    incident_kw = research.keywords(incident_kw)
+    aggregator_kw = research.keywords(aggregator_kw)
+
+    def _is_low_signal(text_lc: str) -> bool:
+        # Expects lowercased text
+        return research.contains_any(text_lc, aggregator_kw)
 
     # Domain weights and AU bias
     scoring_job = job_cfg.get('scoring', {}) if isinstance(job_cfg.get('scoring'), dict) else {}
@@ -432,19 +488,21 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
         parts = (host or '').split('.')
         return '.'.join(parts[-2:]) if len(parts) >= 2 else host
 
-    def _score_candidate(title: str, text: str, url: str) -> float:
+    def _score_candidate(tl: str, url: str) -> float:
+        # tl: lowercased "title text", built once per candidate by process_candidate
         score = 0.0
-        tl = f"{title} {text}".lower()
         # Regional signals
         try:
             netloc = urlparse(url).netloc.lower()
         except Exception:
             netloc = ""
-        if any(d in (url or "") for d in include_domains):
+        # Host suffix lookup: no per-domain substring scans, and no matches on path/query text
+        if research.host_in_domains(netloc.split(":", 1)[0], include_domain_set):
             score += 2.5
         if netloc.endswith('.au'):
             score += 2.0
-        if ("australia" in tl) or ("australian" in tl):
+        # "australian" contains "australia", so one probe covers both
+        if "australia" in tl:
             score += 2.0
         # Domain weights bonus
         if domain_weights:
@@ -457,23 +515,20 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
                     continue
             score += w
         # Business/organization signals
-        if any(k in tl for k in [
-            "business","businesses","company","companies","organisation","organization",
-            "enterprise","sector","industry","sme","smb"
-        ]):
+        if research.contains_any(tl, _BUSINESS_KW):
             score += 1.0
         # Incident keyword boost
         hits = sum(1 for k in incident_kw if k in tl)
         score += min(3.0, 0.7 * hits)
         # CVE presence boost
-        if re.search(r"\bCVE-\d{4}-\d{4,7}\b", tl):
+        if research.CVE_RE.search(tl):
             score += 2.0
         # Penalize obvious aggregator/opinion
         if _is_low_signal(tl):
             score -= 2.0
         # AU bias multiplier
         if au_bias and au_bias != 1.0:
-            if netloc.endswith('.au') or ("australia" in tl) or ("australian" in tl):
+            if netloc.endswith('.au') or ("australia" in tl):
                 try:
                     score *= float(au_bias)
                 except Exception:
@@ -487,13 +542,15 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
         try:
             await _push_log(job_id, 'info', 'discovery_start: api_free')
             tasks = []
+            # All providers share the pooled client, so feeds/sitemaps/crawls on one host reuse a connection
+            http_client = research.get_http_client()
             if rss_provider and rss_urls:
-                tasks.append(asyncio.create_task(rss_provider.discover(rss_urls, recency_days=recency_days, keyword_include=keyword_include, keyword_exclude=keyword_exclude)))
+                tasks.append(asyncio.create_task(rss_provider.discover(rss_urls, recency_days=recency_days, keyword_include=keyword_include, keyword_exclude=keyword_exclude, client=http_client)))
             if sitemap_provider and sitemap_domains:
-                tasks.append(asyncio.create_task(sitemap_provider.discover(sitemap_domains, recency_days=recency_days, keyword_include=keyword_include, keyword_exclude=keyword_exclude)))
+                tasks.append(asyncio.create_task(sitemap_provider.discover(sitemap_domains, recency_days=recency_days, keyword_include=keyword_include, keyword_exclude=keyword_exclude, client=http_client)))
             # Lightweight domain crawl (optional)
             if domain_crawler and include_domains:
-                tasks.append(asyncio.create_task(domain_crawler.discover(include_domains, max_pages_per_domain=int(discovery_cfg.get('max_pages_per_domain', 40)))))
+                tasks.append(asyncio.create_task(domain_crawler.discover(include_domains, max_pages_per_domain=int(discovery_cfg.get('max_pages_per_domain', 40)), client=http_client)))
             pages = await asyncio.gather(*tasks, return_exceptions=True) if tasks else []
             seen_discovery: set[str] = set()
             discovered_candidates = []
@@ -535,13 +592,13 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
         if use_serpapi and getattr(research, 'serpapi_api_key', None):
             try:
                 serp_extra = dict(extra); serp_extra['start'] = page_index * page_size
-                sr = await asyncio.get_event_loop().run_in_executor(None, research._search_serpapi, fq, page_size, 'au', 'en', serp_extra)
+                sr = await research._search_serpapi(fq, page_size, 'au', 'en', serp_extra)
                 results.extend(sr.get('results', []))
             except Exception:
                 await _push_log(job_id, 'warning', f"SERPAPI page {page_index} failed")
         if use_tavily and getattr(research, 'tavily_api_key', None):
             try:
-                tr = await asyncio.get_event_loop().run_in_executor(None, research._search_tavily, fq, page_size, include_domains)
+                tr = await research._search_tavily(fq, page_size, include_domains)
                 results.extend(tr.get('results', []))
             except Exception:
                 pass
@@ -655,9 +712,17 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
         _bump_domain(_domain_of(url), 'fetched')
         await _push_event(job_id, {"type": "progress", "counters": counters, "domains": _top_domains()})
         # Low-signal early filter (optional; otherwise only scored down)
-        if filter_low_signal and _is_low_signal(f"{title_hint} {text}"):
+        # One lowercased copy of title + page text serves every keyword gate, relevance and scoring
+        title = title_hint or 'Untitled Incident'
+        content_lc = f"{title} {text}".lower()
+        if filter_low_signal and _is_low_signal(content_lc):
             await _push_log(job_id, 'info', f"filtered_low_signal: {url}")
             return False
+        # Incident keyword presence (filter to attacks/exploits/breaches); text-only, so it runs
+        # before the LLM call a rejected page would otherwise still pay for
+        if require_incident and not research.contains_any(content_lc, incident_kw):
+            await _push_log(job_id, 'info', f"filtered_non_incident: {url}")
+            return False
         extraction_prompt = None
         try:
             extraction_prompt = job_cfg.get('extraction', {}).get('prompt') if isinstance(job_cfg.get('extraction'), dict) else None
@@ -676,7 +741,15 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
         fields = {}
         llm_ok = True
         try:
-            fields = await _extract_fields_with_llm(llm, text, prompt_template=extraction_prompt, timeout_s=extraction_timeout)
+            sig = research.shingle_signature(research.truncate_for_prompt(text or "", research.MAX_PROMPT_CHARS))
+            task = next((t for other_sig, t in near_dup_extractions
+                         if research.shingle_similarity(sig, other_sig) >= research.NEAR_DUPLICATE_SIMILARITY), None)
+            if task is None:
+                task = asyncio.ensure_future(_extract_fields_with_llm(llm, text, prompt_template=extraction_prompt, timeout_s=extraction_timeout))
+                near_dup_extractions.append((sig, task))
+            else:
+                await _push_log(job_id, 'info', f"reusing_near_duplicate_extraction: {url}")
+            fields = await task
         except Exception as e:
             llm_ok = False
             await _push_log(job_id, 'warning', f"LLM extraction failed: {e}")
@@ -690,7 +763,7 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
             try:
                 first = (text or '')[:1000]
                 # naive sentence split
-                parts = re.split(r"(?<=[.!?])\s+", first)
+                parts = _SENTENCE_END_RE.split(first)
                 summary = " ".join(parts[:3]).strip() or (title_hint or '')
             except Exception:
                 summary = title_hint or ''
@@ -707,7 +780,6 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
                 'incident': False
             }
         counters["parsed"] += 1
-        title = title_hint or 'Untitled Incident'
         summary = (fields.get('summary') or '').strip()
         date = _pretty_date(fields.get('date', '').strip())
         targets = (fields.get('targets') or '').strip()
@@ -722,20 +794,15 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
                 extra_c = [f"{c} {lbl.get(c, '')}".strip() for c in extra_c]
                 exploit_used = ", ".join(filter(None, [exploit_used] + extra_c)).strip(', ')
         # Relevance
-        tl = f"{title} {text}".lower(); rel = ""
-        if any(k in tl for k in ["australia", ".au", "australian"]):
+        rel = ""
+        if research.contains_any(content_lc, _AU_RELEVANCE_KW):
             rel = "Relevant to Australian organizations and sectors."
-        elif any(k in tl for k in ["windows","apple","ios","macos","azure","aws","google cloud","vmware","esxi"]):
+        elif research.contains_any(content_lc, _PLATFORM_RELEVANCE_KW):
             rel = "Global incident impacting widely used platforms; likely to affect Australian businesses."
-        # Incident keyword presence (filter to attacks/exploits/breaches)
-        content_lc = f"{title} {text}".lower()
-        if require_incident and not any(k in content_lc for k in incident_kw):
-            await _push_log(job_id, 'info', f"filtered_non_incident: {url}")
-            return False
 
         # Scoring & gating
-        score = _score_candidate(title, text, url)
-        if require_au and not ("australia" in content_lc or ".au" in (url or '').lower() or "australian" in content_lc):
+        score = _score_candidate(content_lc, url)
+        if require_au and not ("australia" in content_lc or ".au" in (url or '').lower()):
             await _push_log(job_id, 'info', f"filtered_non_au: {url}")
             qa_ok = False
         elif score < min_score or (require_incident and (fields and not fields.get('incident'))):
@@ -790,18 +857,25 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
             await _push_log(job_id, 'info', f"qa_failed: id={draft_id}")
             return False
 
-    # Seed round
+    sem = asyncio.Semaphore(concurrency)
+    async def _run(url: str, title: str):
+        async with sem:
+            try:
+                await _push_log(job_id, 'info', f"queueing: {url}")
+                cur2 = await database.get_research_job(job_id)
+                if int(cur2.get('accepted_count') or 0) >= target:
+                    return
+                await process_candidate(url, title)
+            except Exception as ex:
+                await _push_log(job_id, 'error', f"process_candidate exception: {ex}")
+
+    # Seed round: seeds share the search rounds' concurrency limit instead of running one by one
     if seed_urls:
         await _push_log(job_id, 'info', f"search_round: seed ({len(seed_urls)} urls)")
-        for u in seed_urls:
-            cur = await database.get_research_job(job_id)
-            if int(cur.get('accepted_count') or 0) >= target:
-                break
-            await process_candidate(u, title_hint=u)
+        await asyncio.gather(*(_run(u, u) for u in seed_urls), return_exceptions=True)
 
     # Paginated search rounds (30 per page)
     page_index = 0
-    sem = asyncio.Semaphore(concurrency)
     dynamic_min_score = min_score
     while True:
         cur = await database.get_research_job(job_id)
@@ -817,28 +891,28 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
         await _push_log(job_id, 'info', f"candidates_found: {len(page)}")
         if not page:
             break
-        # Filter to likely-article URLs
+        # Filter to likely-article URLs and drop repeats in the same pass: SERPAPI and Tavily pages
+        # overlap, and each repeat would otherwise queue a task and a job lookup just to be skipped
         filtered = []
         skipped = 0
+        repeats = 0
+        page_keys: set[str] = set()
         for it in page:
             u = it.get('url') or ''
-            if _is_article_url(u):
-                filtered.append(it)
-            else:
+            if not _is_article_url(u):
                 skipped += 1
+                continue
+            key = _canon_url(u).lower()
+            if key in page_keys or key in seen:
+                repeats += 1
+                continue
+            page_keys.add(key)
+            filtered.append(it)
         if skipped:
             await _push_log(job_id, 'info', f"skipping_non_article_urls: {skipped}")
+        if repeats:
+            await _push_log(job_id, 'info', f"skipping_seen_urls: {repeats}")
         tasks = []
-        async def _run(url: str, title: str):
-            async with sem:
-                try:
-                    await _push_log(job_id, 'info', f"queueing: {url}")
-                    cur2 = await database.get_research_job(job_id)
-                    if int(cur2.get('accepted_count') or 0) >= target:
-                        return
-                    await process_candidate(url, title)
-                except Exception as ex:
-                    await _push_log(job_id, 'error', f"process_candidate exception: {ex}")
         for it in filtered:
             url = it.get('url') or ''
             title = it.get('title') or 'Untitled Incident'
@@ -894,7 +968,7 @@ async def run_research_job(job_id: int, seed_urls: list[str] | None = None, focu
     # Append incidents
     for i, d in enumerate(ok, start=1):
         sn = d.get('markdown_snippet') or ''
-        sn = re.sub(r"^##\s*\d+\.", f"## {i}.", sn, flags=re.MULTILINE)
+        sn = _SNIPPET_HEADING_NUM_RE.sub(f"## {i}.", sn)
         md_parts.append(sn)
     final_text = "".join(md_parts)
     try:
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The backend modules import each other as top-level modules and read config.json from the
+# working directory
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
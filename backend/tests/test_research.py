@@ -0,0 +1,229 @@
+import asyncio
+import json
+import logging
+
+import httpx
+
+import research
+
+
+def test_serpapi_key_not_logged(monkeypatch, caplog):
+    secret = "serpapi-secret-key-123"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["api_key"] == secret
+        return httpx.Response(200, json={"organic_results": []})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            monkeypatch.setattr(research, "get_http_client", lambda: client)
+            await research._search_serpapi("acme ransomware log-check", 10)
+
+    monkeypatch.setattr(research, "serpapi_api_key", secret)
+    caplog.set_level(logging.DEBUG)
+    asyncio.run(run())
+    assert all(secret not in record.getMessage() for record in caplog.records)
+
+
+PAGE = (
+    "<html><body><nav><a href='/'>Home</a></nav>"
+    "<h1>Acme hit</h1><p>12 March 2025</p><p>By Jane Citizen</p>"
+    "<p>Acme Corp confirmed a ransomware attack disrupted its Sydney warehouse systems overnight.</p>"
+    "<div><button>Share</button></div></body></html>"
+)
+
+
+def _page_texts():
+    yield research.html_to_text(PAGE)
+    # Regex fallback used when lxml is unavailable or can't parse the page
+    yield research._extract_blocks(research._BOILERPLATE_BLOCK_RE.sub(" ", PAGE))
+
+
+def test_page_text_keeps_short_blocks_for_heuristics():
+    for text in _page_texts():
+        assert "By Jane Citizen" in text
+        assert research._first_text_date(text) == "2025-03-12"
+
+
+def test_prompt_prose_drops_short_blocks():
+    for text in _page_texts():
+        prose = research._prompt_prose(text)
+        assert prose == "Acme Corp confirmed a ransomware attack disrupted its Sydney warehouse systems overnight."
+    snippet = "Acme confirmed an attack."
+    assert research._prompt_prose(snippet) == snippet
+
+
+def test_split_batch_extraction_reads_fenced_arrays():
+    one = '```json\n[{"article": 1, "summary": "a"}]\n```'
+    assert [json.loads(x)["summary"] for x in research._split_batch_extraction(one, 1)] == ["a"]
+    partial = research._split_batch_extraction(one, 2)
+    assert json.loads(partial[0])["summary"] == "a" and partial[1] is None
+    two = '```json\n[{"article": 1, "summary": "a"}, {"article": 2, "summary": "b"}]\n```'
+    assert [json.loads(x)["summary"] for x in research._split_batch_extraction(two, 2)] == ["a", "b"]
+    wrapped = 'Here you go: {"articles": [{"article": 2, "summary": "b"}]}'
+    assert research._split_batch_extraction(wrapped, 2)[1] is not None
+    assert research._split_batch_extraction("no json here", 2) == [None, None]
+
+
+STORY = (
+    "Acme Corp confirmed on Tuesday that a ransomware attack disrupted its Sydney warehouse "
+    "systems and that customer names and addresses may have been accessed by the attackers"
+)
+
+
+def test_near_duplicate_similarity_matches_syndicated_copies():
+    copy = research.shingle_signature(STORY + " Reporting by the newswire.")
+    original = research.shingle_signature(STORY)
+    assert research.shingle_similarity(original, copy) >= research.NEAR_DUPLICATE_SIMILARITY
+
+
+def test_near_duplicate_similarity_rejects_page_inside_a_roundup():
+    roundup = " ".join([
+        "This week in breaches: Globex disclosed a phishing campaign against its payroll staff",
+        STORY,
+        "Initech said a misconfigured storage bucket exposed internal documents for several months",
+        "and Umbrella Health is still investigating an outage that took its patient portal offline",
+    ])
+    short = research.shingle_signature(STORY)
+    assert research.shingle_similarity(short, research.shingle_signature(roundup)) < research.NEAR_DUPLICATE_SIMILARITY
+
+
+def test_prefilter_keeps_distinct_articles_sharing_boilerplate():
+    boilerplate = "Subscribe to continue reading. Already a subscriber? Log in to read the full ransomware and breach coverage."
+    results = [
+        {"url": "https://news.example.com.au/2025/03/12/acme-ransomware", "title": "Acme hit by ransomware", "content": boilerplate},
+        {"url": "https://news.example.com.au/2025/03/13/globex-breach", "title": "Globex data breach exposes staff", "content": boilerplate},
+    ]
+    assert research._prefilter_report_results(results) == results
+
+
+def test_prefilter_drops_syndicated_copies():
+    snippet = "Acme Corp confirmed a ransomware attack disrupted its Sydney warehouse systems and customer data may have been accessed."
+    results = [
+        {"url": "https://news.example.com.au/2025/03/12/acme-ransomware", "title": "Acme hit by ransomware", "content": snippet},
+        {"url": "https://wire.example.com/acme-ransomware-attack", "title": "Acme hit by ransomware", "content": snippet},
+    ]
+    assert research._prefilter_report_results(results) == results[:1]
+
+
+def test_result_canon_leaves_result_dicts_untouched():
+    result = {"url": "https://www.example.com.au/news/acme-breach/?utm_source=x", "title": "t", "content": "c"}
+    snapshot = dict(result)
+    assert research._result_canon(result) == "example.com.au/news/acme-breach"
+    assert result == snapshot
+
+
+def test_canonical_url_keeps_path_case():
+    assert research._canonicalize_url("https://WWW.Example.com.au/News/A/") == "example.com.au/News/A"
+    assert research._canonicalize_url("https://example.com.au/News/A") != research._canonicalize_url("https://example.com.au/news/a")
+
+
+class _Reply:
+    def __init__(self, content):
+        self.content = content
+
+
+class _FakeLLM:
+    """Answers extraction prompts with one incident per article and counts the calls."""
+
+    model = "fake"
+
+    def __init__(self):
+        self.calls = []
+
+    async def ainvoke(self, prompt):
+        count = sum(1 for line in prompt.split("\n") if line.startswith("Article "))
+        self.calls.append(count)
+        fields = {"summary": "S", "date_of_incident": "2025-03-12", "targets": "Acme Corp",
+                  "method": "Ransomware", "exploit_used": "", "incident": True}
+        if count:
+            return _Reply(json.dumps({"articles": [dict(fields, article=i + 1) for i in range(count)]}))
+        return _Reply(json.dumps(fields))
+
+
+def _install_fakes(monkeypatch, handler):
+    pages = {}
+
+    async def get_cached_article(key, max_age_hours):
+        return pages.get(key)
+
+    async def upsert_cached_article(key, url, text, html, etag=None, last_modified=None):
+        pages[key] = (text, html, etag, last_modified, True)
+
+    async def no_extraction(*args):
+        return None
+
+    monkeypatch.setattr(research.database, "get_cached_article", get_cached_article)
+    monkeypatch.setattr(research.database, "upsert_cached_article", upsert_cached_article)
+    monkeypatch.setattr(research.database, "get_cached_extraction", no_extraction)
+    monkeypatch.setattr(research.database, "upsert_cached_extraction", no_extraction)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(research, "get_http_client", lambda: client)
+    return pages
+
+
+async def _format(results, llm):
+    out = await asyncio.wait_for(research.format_raw_results(results, 0, llm, enforce_min=False), 10)
+    # Let the background page-cache writes land
+    for _ in range(5):
+        await asyncio.sleep(0)
+    return out
+
+
+def test_page_cache_keeps_query_distinct_urls_apart(monkeypatch):
+    def handler(request):
+        article = request.url.params["id"]
+        body = f"<p>{'Acme Corp confirmed a ransomware attack on its systems in Australia. ' * 30} Article {article}.</p>"
+        return httpx.Response(200, text=f"<html><body>{body}</body></html>")
+
+    pages = _install_fakes(monkeypatch, handler)
+    results = [
+        {"url": f"https://news.example.com.au/article.php?id={i}", "title": f"Acme story {i} ransomware",
+         "content": f"Acme Corp ransomware attack in Australia, story {i}"}
+        for i in (1, 2)
+    ]
+    asyncio.run(_format(results, _FakeLLM()))
+    assert set(pages) == {"https://news.example.com.au/article.php?id=1", "https://news.example.com.au/article.php?id=2"}
+    assert pages["https://news.example.com.au/article.php?id=1"][0].endswith("Article 1.")
+    assert pages["https://news.example.com.au/article.php?id=2"][0].endswith("Article 2.")
+
+
+def _fetch_fails(request):
+    return httpx.Response(503)
+
+
+def _incident(i, text):
+    return {"url": f"https://news{i}.example.com.au/2025/03/12/story-{i}", "title": f"Story {i}: ransomware attack", "content": text}
+
+
+def test_partial_extraction_batch_flushes_once_every_candidate_settles(monkeypatch):
+    monkeypatch.setattr(research, "EXTRACTION_BATCH_SIZE", 4)
+    _install_fakes(monkeypatch, _fetch_fails)
+    results = [
+        _incident(i, f"{org} confirmed a ransomware attack on its {site} systems in Australia. " * 3)
+        for i, (org, site) in enumerate([("Acme Corp", "Sydney"), ("Globex", "Perth"), ("Initech", "Hobart")])
+    ]
+    llm = _FakeLLM()
+    out = asyncio.run(_format(results, llm))
+    assert llm.calls == [3]
+    assert out.count("## ") == 3
+
+
+def test_near_duplicate_waiter_does_not_hold_back_the_batch(monkeypatch):
+    monkeypatch.setattr(research, "EXTRACTION_BATCH_SIZE", 4)
+    _install_fakes(monkeypatch, _fetch_fails)
+    story = (
+        "Acme Corp confirmed a ransomware attack on its Sydney warehouse systems in Australia overnight. "
+        "The company said deliveries were delayed while staff restored its servers from backups. "
+        "Acme has notified the Australian Cyber Security Centre and is working with external investigators. "
+        "Customers were told that order history and phone numbers may have been accessed by the attackers. "
+    )
+    results = [
+        _incident(0, story),
+        _incident(1, story + "Updated with comment from Acme."),
+        _incident(2, "Globex confirmed a ransomware attack on its Perth systems in Australia. " * 3),
+    ]
+    llm = _FakeLLM()
+    out = asyncio.run(_format(results, llm))
+    assert llm.calls == [2]
+    assert out.count("## ") == 3
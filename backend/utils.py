@@ -27,6 +27,8 @@ os.makedirs(PDF_DIRECTORY, exist_ok=True)
 os.makedirs(OUTPUT_DIRECTORY, exist_ok=True)
 os.makedirs(LOG_DIRECTORY, exist_ok=True)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# httpx logs every request URL at INFO, and SERPAPI takes its api_key as a query parameter
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # If a Tesseract path is provided in the config, set it
 TESSERACT_PATH = config.get('tesseract_path')
@@ -113,7 +115,7 @@ def perform_ocr_on_pdf_bytes(file_content: bytes) -> str:
     Performs OCR on each page of a PDF and returns the combined text.
     """
     # The Tesseract path is now configured globally at startup.
-    text = ""
+    page_texts = []
     logging.info("Performing OCR on PDF...")
     try:
         pdf_document = fitz.open(stream=file_content, filetype="pdf")
@@ -125,11 +127,12 @@ def perform_ocr_on_pdf_bytes(file_content: bytes) -> str:
             
             # Use pytesseract to do OCR on the image
             page_text = pytesseract.image_to_string(image)
-            text += page_text + "\n"
+            page_texts.append(page_text)
         
         pdf_document.close()
         logging.info("OCR completed successfully.")
-        return text
+        # Joined once at the end instead of re-copying the accumulated text per page
+        return "".join(f"{t}\n" for t in page_texts)
     
     except pytesseract.TesseractNotFoundError:
         error_msg = "TesseractNotFoundError: The Tesseract executable was not found. Please make sure it is installed and the path is correct in utils.py."